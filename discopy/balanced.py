@@ -48,6 +48,8 @@ class Diagram(braided.Diagram):
         dom (monoidal.Ty) : The domain of the diagram, i.e. its input.
         cod (monoidal.Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = True
 
     @classmethod
@@ -106,6 +108,8 @@ class Box(braided.Box, Diagram):
         dom (monoidal.Ty) : The domain of the box, i.e. its input.
         cod (monoidal.Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (braided.Box, )
 
 
@@ -76,6 +76,8 @@ class Diagram(monoidal.Diagram):
         dom (monoidal.Ty) : The domain of the diagram, i.e. its input.
         cod (monoidal.Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = True
 
     @classmethod
@@ -113,6 +115,8 @@ class Box(monoidal.Box, Diagram):
         dom (monoidal.Ty) : The domain of the box, i.e. its input.
         cod (monoidal.Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (monoidal.Box, )
 
 
@@ -79,17 +79,22 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import total_ordering, cached_property
+from functools import total_ordering
+from itertools import chain
 from typing import (
     Callable, Mapping, Iterable, Optional, TypeVar, Generic, Type)
 
-from discopy import messages, utils
+from discopy import messages, utils, config
 from discopy.utils import (
     factory_name,
     from_tree,
     rsubs,
     mmap,
     assert_isinstance,
+    interned,
+    cached_slot,
+    getstate,
+    LRUCache,
     MappingOrCallable,
 )
 
@@ -97,6 +102,8 @@ dumps, loads = utils.dumps, utils.loads
 
 T = TypeVar('T')
 
+HASH_BASE, HASH_MODULUS = 1000003, (1 << 61) - 1
+
 
 @total_ordering
 class Ob:
@@ -111,10 +118,14 @@ class Ob:
     >>> x, x_, y = Ob('x'), Ob('x'), Ob('y')
     >>> assert x == x_ and x != y
     """
+    __slots__ = ("name", "__weakref__")
+
     def __init__(self, name: str = ""):
         assert_isinstance(name, str)
         self.name = name
 
+    __getstate__ = getstate
+
     def __repr__(self):
         return f"{factory_name(type(self))}({repr(self.name)})"
 
@@ -125,7 +136,7 @@ class Ob:
         return isinstance(other, type(self)) and self.name == other.name
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self.name)
 
     def __lt__(self, other):
         return self.name < other.name
@@ -170,6 +181,8 @@ class Composable(ABC, Generic[T]):
     >>> assert List([1, 2]) >> List([3]) == List([1, 2, 3])
     >>> assert List([3]) << List([1, 2]) == List([1, 2, 3])
     """
+    __slots__ = ()
+
     factory: Type[Composable]
     sum_factory: Type[Composable]
     ty_factory: Type[T]
@@ -260,7 +273,7 @@ class Arrow(Composable[Ob]):
         inside: The tuple of boxes inside an arrow.
         dom: The domain of an arrow, i.e. its input.
         cod: The codomain of an arrow, i.e. output
-        _scan: Whether to check composition.
+        _scan: Whether to check composition, see :meth:`Arrow.validate`.
 
     .. admonition:: Summary
 
@@ -270,6 +283,7 @@ class Arrow(Composable[Ob]):
             then
             dagger
             bubble
+            validate
 
     Tip
     ---
@@ -297,19 +311,54 @@ class Arrow(Composable[Ob]):
     automatically cast. This means one can use e.g. ``int`` instead of ``Ob``,
     see :class:`monoidal.PRO`.
     """
+    # The slot "encoding_cache" is used by :attr:`monoidal.Diagram.encoding`,
+    # it is declared here so that boxes and diagrams share one layout.
+    __slots__ = (
+        "inside", "dom", "cod", "_hash_inside_cache", "encoding_cache",
+        "__weakref__")
+
     ty_factory = Ob
 
+    __getstate__ = getstate
+
     def __init__(self, inside: tuple[Box, ...], dom: Ob | str, cod: Ob | str,
                  _scan: bool = True) -> None:
         ty_factory = type(self).ty_factory
         dom = dom if isinstance(dom, ty_factory) else ty_factory(dom)
         cod = cod if isinstance(cod, ty_factory) else ty_factory(cod)
         self.dom, self.cod, self.inside = dom, cod, inside
-        if _scan:
-            for box in inside:
-                assert_isinstance(box, Box)
-            for f, g in zip((Id(dom), ) + inside, inside + (Id(cod), )):
-                assert_iscomposable(f, g)
+        if _scan and not config.TRUSTED:
+            self.validate()
+
+    def validate(self) -> None:
+        """
+        Check that the boxes inside an arrow compose, this is called by the
+        constructor unless :func:`discopy.utils.trusted` mode is on.
+
+        Raises
+        ------
+        TypeError
+            If some element inside is not a :class:`Box`.
+        AxiomError
+            If two consecutive boxes do not compose.
+
+        Example
+        -------
+        >>> from discopy.utils import trusted
+        >>> x, y = Ob('x'), Ob('y')
+        >>> f = Box('f', x, y)
+        >>> with trusted():
+        ...     arrow = Arrow((f, f), x, y)
+        >>> arrow.validate()
+        Traceback (most recent call last):
+        ...
+        discopy.cat.AxiomError: f does not compose with f: y != x.
+        """
+        for box in self.inside:
+            assert_isinstance(box, Box)
+        for f, g in zip((Id(self.dom), ) + self.inside,
+                        self.inside + (Id(self.cod), )):
+            assert_iscomposable(f, g)
 
     def __iter__(self):
         for box in self.inside:
@@ -352,11 +401,30 @@ class Arrow(Composable[Ob]):
         return ' >> '.join(map(str, self.inside)) or f"Id({self.dom})"
 
     def __eq__(self, other):
-        return isinstance(other, self.factory)\
+        return self is other or isinstance(other, self.factory)\
             and self.is_parallel(other) and self.inside == other.inside
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.dom, self.cod, self._hash_inside))
+
+    @cached_slot
+    def _hash_inside(self) -> int:
+        """
+        The polynomial hash of the boxes inside an arrow, computed once and
+        combined in constant time by :meth:`Arrow.then`.
+
+        Example
+        -------
+        >>> x = Ob('x')
+        >>> f, g = Box('f', x, x), Box('g', x, x)
+        >>> h = f >> g
+        >>> assert h._hash_inside == Arrow((f, g), x, x)._hash_inside
+        >>> assert hash(h >> h) == hash(Arrow((f, g, f, g), x, x))
+        """
+        result = 0
+        for box in self.inside:
+            result = (result * HASH_BASE + box._hash_box) % HASH_MODULUS
+        return result
 
     def __add__(self, other):
         return self.sum_factory((self, )) + other
@@ -393,15 +461,45 @@ class Arrow(Composable[Ob]):
 
         Raises:
             cat.AxiomError : Whenever `self` and `others` do not compose.
+
+        Note
+        ----
+        Only the junctions between the arrows are checked, so composing ``n``
+        arrows at once takes linear time. The boxes inside are still copied
+        into a new tuple on each call, so that building an arrow one box at a
+        time with ``>>`` takes quadratic time, albeit in a single tuple copy
+        per step. For long chains, compose all the arrows at once instead.
+
+        >>> x = Ob('x')
+        >>> boxes = [Box(f'f{i}', x, x) for i in range(1000)]
+        >>> arrow = Arrow.id(x)
+        >>> for box in boxes:  # Quadratic time.
+        ...     arrow = arrow >> box
+        >>> assert arrow == Arrow.id(x).then(*boxes)  # Linear time.
         """
         if any(isinstance(other, Sum) for other in others):
             return self.sum_factory((self, )).then(*others)
-        inside, dom, cod = self.inside, self.dom, self.cod
+        insides, last = [self.inside], self
         for other in others:
             assert_isinstance(other, self.factory)
             assert_isinstance(self, other.factory)
-            inside, cod = inside + other.inside, other.cod
-        return self.factory(inside, dom, cod)
+            assert_iscomposable(last, other)
+            insides.append(other.inside)
+            last = other
+        # The arrows are already well-typed, we only need to check that they
+        # compose with one another and concatenate their insides once.
+        inside = tuple(chain.from_iterable(insides))
+        result = self.factory(inside, self.dom, last.cod, _scan=False)
+        arrows = (self, ) + others
+        if all(cached_slot.is_cached(arrow, "_hash_inside")
+               for arrow in arrows):
+            hash_inside = 0
+            for arrow in arrows:
+                hash_inside = (hash_inside * pow(
+                    HASH_BASE, len(arrow.inside), HASH_MODULUS)
+                    + arrow._hash_inside) % HASH_MODULUS
+            result._hash_inside = hash_inside
+        return result
 
     def dagger(self) -> Arrow:
         """ Contravariant involution, called with :code:`[::-1]`. """
@@ -556,13 +654,16 @@ class Box(Arrow):
     >>> f = Box('f', x, y, data=[42])
     >>> assert f.inside == (f, )
     """
+    __slots__ = (
+        "name", "data", "is_dagger", "free_symbols_cache", "_hash_box_cache")
+
     def __init__(
             self, name: str, dom: Ob, cod: Ob, data=None, is_dagger=False):
         assert_isinstance(name, str)
         self.name, self.data, self.is_dagger = name, data, is_dagger
         Arrow.__init__(self, (self, ), dom, cod, _scan=False)
 
-    @cached_property
+    @cached_slot
     def free_symbols(self) -> "set[sympy.Symbol]":
         def recursive_free_symbols(data):
             if isinstance(data, Mapping):
@@ -591,8 +692,8 @@ class Box(Arrow):
             data=lambdify(symbols, self.data, **kwargs)(*xs))
 
     def dagger(self) -> Box:
-        return type(self)(
-            self.name, self.cod, self.dom,
+        return interned(
+            type(self), self.name, self.cod, self.dom,
             data=self.data, is_dagger=not self.is_dagger)
 
     def __getitem__(self, key):
@@ -611,8 +712,12 @@ class Box(Arrow):
     def __str__(self):
         return str(self.name) + ("[::-1]" if self.is_dagger else '')
 
-    def __hash__(self):
-        return hash(Arrow.__repr__(self))
+    __hash__ = Arrow.__hash__
+
+    @cached_slot
+    def _hash_box(self) -> int:
+        """ The hash of a box as a generator, ignoring its ``data``. """
+        return hash((self.name, self.dom, self.cod, self.is_dagger))
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
@@ -694,7 +799,8 @@ class Sum(Box):
         return len(self.terms) == 1 and self.terms[0] == other
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self.terms[0]) if len(self.terms) == 1\
+            else hash((self.dom, self.cod, self.terms))
 
     def __repr__(self):
         return self.name
@@ -869,8 +975,13 @@ class Functor(Composable[Category]):
     >>> assert F(m) == m
     >>> m.data.append(False)
     >>> assert F(m) == m[::-1]
+
+    Tip
+    ---
+    The images of boxes and objects can be cached with :meth:`memoize`.
     """
     dom = cod = Category(Ob, Arrow)
+    cache: LRUCache | None = None
 
     @classmethod
     def id(cls, dom: Category = None) -> Functor:
@@ -932,6 +1043,39 @@ class Functor(Composable[Category]):
         return factory_name(type(self))\
             + f"(ob={self.ob}, ar={self.ar}{cod_repr})"
 
+    def memoize(self, maxsize: int | None = 1024) -> Functor:
+        """
+        Cache the images of the boxes and objects inside composite arrows,
+        evicting the least recently used ones once there are more than
+        ``maxsize`` of them.
+
+        Parameters:
+            maxsize : The size of the cache, unbounded if ``None``.
+
+        Note
+        ----
+        The cache assumes that the mappings ``ob`` and ``ar`` and the data of
+        the boxes do not change. Otherwise, call ``self.cache.clear()``.
+
+        Example
+        -------
+        >>> x, y = Ob('x'), Ob('y')
+        >>> f = Box('f', x, y)
+        >>> F = Functor({x: y, y: x}, lambda f: f[::-1]).memoize(maxsize=8)
+        >>> assert F(f >> f[::-1] >> f) == f[::-1] >> f >> f[::-1]
+        >>> F.cache.hits, F.cache.misses, len(F.cache)
+        (1, 2, 2)
+        >>> F.cache.clear()
+        >>> F.cache.hits, F.cache.misses, len(F.cache)
+        (0, 0, 0)
+        """
+        self.cache = LRUCache(maxsize)
+        return self
+
+    def _memoized_call(self, other):
+        return self(other) if self.cache is None\
+            else self.cache.lookup(other, self)
+
     def __call__(self, other):
         if isinstance(other, Ob):
             return self.ob[other]
@@ -950,8 +1094,12 @@ class Functor(Composable[Category]):
                 else self.cod.ar(result, self(other.dom), self(other.cod))
         assert_isinstance(other, Arrow)
         result = self.cod.ar.id(self(other.dom))
+        if isinstance(result, Arrow):
+            # Composing all the images at once takes linear rather than
+            # quadratic time in the length of the arrow.
+            return result.then(*map(self._memoized_call, other.inside))
         for box in other.inside:
-            result = result >> self(box)
+            result = result >> self._memoized_call(box)
         return result
 
 
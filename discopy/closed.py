@@ -82,6 +82,8 @@ class Ty(monoidal.Ty):
     >>> print((x >> y) << z)
     ((x >> y) << z)
     """
+    __slots__ = ()
+
     def __pow__(self, other: Ty) -> Ty:
         return Exp(self, other) if isinstance(other, Ty)\
             else super().__pow__(other)
@@ -122,7 +124,7 @@ class Exp(Ty, cat.Ob):
         return isinstance(other, Ty) and other.inside == (self, )
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.base, self.exponent))
 
     def __str__(self):
         return f"({self.base} ** {self.exponent})"
@@ -177,6 +179,8 @@ class Diagram(monoidal.Diagram):
         dom (Ty) : The domain of the diagram, i.e. its input.
         cod (Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = True
 
     ty_factory = Ty
@@ -225,6 +229,8 @@ class Box(monoidal.Box, Diagram):
         dom (Ty) : The domain of the box, i.e. its input.
         cod (Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (monoidal.Box, )
 
 
@@ -35,6 +35,8 @@ class Diagram(symmetric.Diagram, ribbon.Diagram):
         dom (pivotal.Ty) : The domain of the diagram, i.e. its input.
         cod (pivotal.Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     ty_factory = Ty
 
 
@@ -47,6 +49,8 @@ class Box(symmetric.Box, ribbon.Box, Diagram):
         dom (pivotal.Ty) : The domain of the box, i.e. its input.
         cod (pivotal.Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (symmetric.Box, ribbon.Box, )
 
 
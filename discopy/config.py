@@ -3,7 +3,11 @@
 """ Discopy configuration. """
 
 DEFAULT_BACKEND = 'numpy'
+DEFAULT_PRECISION = 'double'
+INTERNING = False
+TRUSTED = False
 NUMPY_THRESHOLD = 16
+PATH_CACHE_SIZE = 1024
 IGNORE_WARNINGS = [
     "No GPU/TPU found, falling back to CPU.",
     "Casting complex values to real discards the imaginary part"]
@@ -42,6 +42,8 @@ class Ob(pivotal.Ob):
     Parameters:
         name : The name of the object.
     """
+    __slots__ = ()
+
     l = r = property(lambda self: self)
 
 
@@ -53,6 +55,8 @@ class Ty(pivotal.Ty):
     Parameters:
         inside (frobenius.Ob) : The objects inside the type.
     """
+    __slots__ = ()
+
     ob_factory = Ob
 
 
@@ -66,6 +70,8 @@ class Diagram(compact.Diagram):
         dom (Ty) : The domain of the diagram, i.e. its input.
         cod (Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     ty_factory = Ty
 
     @classmethod
@@ -123,6 +129,8 @@ class Box(compact.Box, Diagram):
         dom (Ty) : The domain of the box, i.e. its input.
         cod (Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (compact.Box, )
 
 
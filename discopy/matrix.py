@@ -15,6 +15,8 @@ Summary
     JAX
     PyTorch
     TensorFlow
+    Sparse
+    Precision
 
 .. admonition:: Functions
 
@@ -25,6 +27,8 @@ Summary
 
         backend
         get_backend
+        precision
+        get_precision
 
 See also
 --------
@@ -46,7 +50,7 @@ from discopy.cat import (
     assert_isparallel,
 )
 from discopy.monoidal import Whiskerable
-from discopy.utils import assert_isinstance, mmap
+from discopy.utils import assert_isinstance, factory_name, mmap
 
 
 @factory
@@ -178,7 +182,8 @@ class Matrix(Composable[int], Whiskerable):
             return np.isclose(self.array, other.array).all()
 
     def __repr__(self):
-        np_array = getattr(self.array, 'numpy', lambda: self.array)()
+        np_array = getattr(self.array, 'numpy', getattr(
+            self.array, 'todense', lambda: self.array))()
         return type(self).__name__ + f"({array2string(np_array.reshape(-1))},"\
                                      f" dom={self.dom}, cod={self.cod})"
 
@@ -405,6 +410,43 @@ class TensorFlow(Backend):
         super().__init__(tnp)
 
 
+class Sparse(Backend):
+    """
+    N-dimensional sparse arrays in COO format, with :code:`pydata-sparse`.
+
+    Example
+    -------
+    >>> from discopy.tensor import Dim, Tensor
+    >>> with backend('sparse'):
+    ...     v = Tensor([0, 1], Dim(1), Dim(2))
+    ...     m = Tensor.swap(Dim(2), Dim(2))
+    ...     print(type((v @ v >> m).array).__name__, (v @ v >> m).array.nnz)
+    COO 1
+    """
+    def __init__(self):
+        import sparse
+        super().__init__(sparse, array=self.asarray)
+
+    def asarray(self, array, dtype=None):
+        """ Convert to a sparse array, keeping sparse arrays as they are. """
+        if isinstance(array, self.module.SparseArray):
+            return array if dtype is None else array.astype(dtype)
+        import numpy
+        return self.module.COO.from_numpy(numpy.asarray(array, dtype=dtype))
+
+    def identity(self, n, dtype=None):
+        return self.module.eye(n, dtype=dtype)
+
+    def conjugate(self, array):
+        return self.module.conj(array)
+
+    def around(self, array, decimals=0):
+        return self.module.round(array, decimals=decimals)
+
+    def isclose(self, a, b, rtol=1e-05, atol=1e-08):
+        return abs(a - b) <= atol + rtol * abs(b)
+
+
 BACKENDS = {
     'np': NumPy,
     'numpy': NumPy,
@@ -413,6 +455,7 @@ BACKENDS = {
     'pytorch': PyTorch,
     'torch': PyTorch,
     'tensorflow': TensorFlow,
+    'sparse': Sparse,
 }
 
 
@@ -431,3 +474,95 @@ def backend(name=None, _stack=[config.DEFAULT_BACKEND], _cache=dict()):
 def get_backend():
     with backend() as result:
         return result
+
+
+class Precision:
+    """
+    A dtype policy, i.e. a map from the datatype requested for an evaluation
+    to the ``storage`` datatype of box arrays and to the ``accumulation``
+    datatype of the contraction.
+
+    Parameters:
+        name : The name of the policy.
+        storage : The storage datatype of each requested datatype.
+        accumulation : The accumulation datatype of each requested datatype.
+
+    Note
+    ----
+    Datatypes which are not in the maps, e.g. ``int``, are left as they are.
+
+    Example
+    -------
+    >>> with precision('mixed') as policy:
+    ...     print(policy.storage_dtype(complex).__name__,
+    ...           policy.accumulation_dtype(complex).__name__)
+    complex64 complex
+    """
+    def __init__(self, name: str, storage: dict[type, type] = None,
+                 accumulation: dict[type, type] = None):
+        self.name, self.storage = name, storage or {}
+        self.accumulation = accumulation or {}
+
+    def storage_dtype(self, dtype: type) -> type:
+        """ The datatype in which to store the arrays of boxes. """
+        return self.storage.get(dtype, dtype)
+
+    def accumulation_dtype(self, dtype: type) -> type:
+        """ The datatype in which to contract arrays. """
+        return self.accumulation.get(dtype, dtype)
+
+    def __repr__(self):
+        return factory_name(type(self)) + f"({repr(self.name)})"
+
+
+def single_precision(name="single", accumulate=False):
+    """ The policy with 32 bits floats, accumulated in 64 bits if mixed. """
+    import numpy
+    single = {float: numpy.float32, numpy.float64: numpy.float32,
+              complex: numpy.complex64, numpy.complex128: numpy.complex64}
+    return Precision(name, single, None if accumulate else single)
+
+
+PRECISIONS = {
+    'double': lambda: Precision('double'),
+    'single': single_precision,
+    'mixed': lambda: single_precision('mixed', accumulate=True),
+}
+
+
+_precision_stack = [config.DEFAULT_PRECISION]
+_precision_cache = dict()
+
+
+@contextmanager
+def precision(name: str = None):
+    """
+    Context manager for the dtype policy of evaluations, see
+    :class:`Precision`, with ``config.DEFAULT_PRECISION`` as default.
+
+    Parameters:
+        name : The name of the policy, i.e. one of ``"double"``, ``"single"``
+            or ``"mixed"``, the current one if ``None``.
+
+    Example
+    -------
+    >>> with precision('single') as policy:
+    ...     assert get_precision() is policy
+    ...     with precision() as current:
+    ...         assert current is policy
+    >>> get_precision()
+    matrix.Precision('double')
+    """
+    name = name or _precision_stack[-1]
+    _precision_stack.append(name)
+    try:
+        if name not in _precision_cache:
+            _precision_cache[name] = PRECISIONS[name]()
+        yield _precision_cache[name]
+    finally:
+        _precision_stack.pop()
+
+
+def get_precision():
+    with precision() as result:
+        return result
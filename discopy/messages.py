@@ -21,7 +21,15 @@ MATRIX_REPEAT_ERROR = "The reflexive transitive closure is only defined for "\
                       "square boolean matrices."
 PROVIDE_CONTRACTOR = "Provide a contractor when using a non-numpy backend."
 BOX_IS_MIXED = "Pure boxes can have only digits or only qudits as dom and cod."
+NOT_PURE = "Expected a pure circuit, got {}."
+UNKNOWN_SIMULATOR = "Unknown simulator {!r}."
+NOT_CLIFFORD = "Expected a Clifford circuit from no inputs to bits, got {}."
+CLASSICAL_COMMAND = "Only measurements can act on bits, got {}."
 LAYERS_MUST_BE_ODD = "Layers must have an odd number of boxes and types."
+WRONG_LENGTH = "Expected as many boxes as offsets, got {} and {}."
+WRONG_NUMBER_OF_ARRAYS = "Expected {} arrays, got {}."
+UNKNOWN_STRATEGY = "Unknown contraction strategy {!r}."
+MEMORY_LIMIT = "Cannot contract with intermediates of at most {} entries."
 NOT_MERGEABLE = "Layers {} and {} cannot be merged."
 INTERCHANGER_ERROR = "Boxes {} and {} do not commute."
 WRONG_PERMUTATION = "Expected a permutation of length {}, got {}."
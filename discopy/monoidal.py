@@ -14,6 +14,7 @@ Summary
     Ty
     PRO
     Layer
+    Encoding
     Diagram
     Box
     Sum
@@ -54,11 +55,19 @@ from __future__ import annotations
 
 import itertools
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import Iterator
 
-from discopy import cat, drawing, messages
+from discopy import cat, config, drawing, messages
 from discopy.cat import factory, Ob, AxiomError, assert_iscomposable
-from discopy.utils import factory_name, from_tree, assert_isinstance
+from discopy.utils import (
+    factory_name,
+    from_tree,
+    assert_isinstance,
+    interned,
+    uninterned,
+    cached_slot,
+)
 
 
 @factory
@@ -92,6 +101,8 @@ class Ty(cat.Ob):
     >>> assert t[0] != t.inside[0] == Ob('x')
     >>> assert t[1:] == t[-2:] == Ty('y', 'z')
     """
+    __slots__ = ("inside", "_hash_cache")
+
     ob_factory = cat.Ob
 
     __ambiguous_inheritance__ = True
@@ -99,9 +110,13 @@ class Ty(cat.Ob):
     def __init__(self, *inside: str | cat.Ob):
         for obj in inside:
             assert_isinstance(obj, (str, self.ob_factory))
-        self.inside = tuple(
-            self.ob_factory(x) if isinstance(x, str) else x for x in inside)
-        super().__init__(str(self))
+        self.inside = tuple(interned(self.ob_factory, x)
+                            if isinstance(x, str) else x for x in inside)
+
+    @property
+    def name(self) -> str:
+        """ The name of a type, computed only when needed. """
+        return str(self)
 
     def tensor(self, *others: Ty) -> Ty:
         """
@@ -123,8 +138,11 @@ class Ty(cat.Ob):
                 return NotImplemented
             assert_isinstance(self, other.factory)
             assert_isinstance(other, self.factory)
+        nonempty = [t for t in (self, ) + others if t.inside]
+        if len(nonempty) == 1 and type(nonempty[0]) is self.factory:
+            return nonempty[0]  # Types are immutable, we can share them.
         inside = self.inside + tuple(x for t in others for x in t.inside)
-        return self.factory(*inside)
+        return interned(self.factory, *inside)
 
     def count(self, obj: cat.Ob) -> int:
         """
@@ -146,7 +164,7 @@ class Ty(cat.Ob):
     def to_drawing(self) -> Ty:
         """ Called before :meth:`Diagram.draw`. """
         def obj_to_drawing(obj):
-            result = cat.Ob(str(obj))
+            result = DrawingOb(str(obj))
             result.always_draw_label = getattr(obj, "always_draw_label", False)
             return result
         return Ty(*map(obj_to_drawing, self.inside))
@@ -157,10 +175,15 @@ class Ty(cat.Ob):
         return len(self) == 1
 
     def __eq__(self, other):
-        return isinstance(other, self.factory) and self.inside == other.inside
+        return self is other or isinstance(other, self.factory)\
+            and self.inside == other.inside
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
+
+    @cached_slot
+    def _hash(self) -> int:
+        return hash(self.inside)
 
     def __repr__(self):
         return factory_name(type(self))\
@@ -178,7 +201,7 @@ class Ty(cat.Ob):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return self.factory(*self.inside[key])
+            return interned(self.factory, *self.inside[key])
         return cat.Arrow.__getitem__(self, key)
 
     def __pow__(self, n_times):
@@ -226,6 +249,8 @@ class PRO(Ty):
 
     >>> assert CX @ 2 >> 2 @ CX == CX @ CX
     """
+    __slots__ = ("n", )
+
     def __init__(self, n: int = 0):
         assert_isinstance(n, int)
         self.n = n
@@ -240,11 +265,12 @@ class PRO(Ty):
                 return NotImplemented  # This allows whiskering on the left.
             assert_isinstance(self, other.factory)
             assert_isinstance(other, self.factory)
-        return self.factory(self.n + sum(other.n for other in others))
+        n = self.n + sum(other.n for other in others)
+        return interned(self.factory, n)
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return self.factory(len(self.inside[key]))
+            return interned(self.factory, len(self.inside[key]))
         return cat.Arrow.__getitem__(self, key)
 
     def __len__(self):
@@ -260,13 +286,13 @@ class PRO(Ty):
         return isinstance(other, self.factory) and self.n == other.n
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self.n)
 
     def __pow__(self, n_times):
         return self.factory(n_times * self.n)
 
     def to_drawing(self):
-        return Ty(*self.n * [Ob()])
+        return Ty(*self.n * [DrawingOb()])
 
     def to_tree(self):
         return {'factory': factory_name(type(self)), 'n': self.n}
@@ -276,6 +302,23 @@ class PRO(Ty):
         return cls(tree['n'])
 
 
+class DrawingOb(cat.Ob):
+    """
+    An object in a drawing, i.e. the output of :meth:`Ty.to_drawing`.
+
+    Note
+    ----
+    Plain objects have ``__slots__``, drawing objects have a ``__dict__``
+    so they can carry extra attributes, e.g. ``always_draw_label``.
+
+    Example
+    -------
+    >>> x = Ty('x').to_drawing().inside[0]
+    >>> x.always_draw_label = True
+    >>> assert x == DrawingOb('x')
+    """
+
+
 class Layer(cat.Box):
     """
     A layer is a :code:`box` in the middle of a pair of types
@@ -288,22 +331,24 @@ class Layer(cat.Box):
         more : More boxes and types to the right,
                used by :meth:`Diagram.foliation`.
     """
+    __slots__ = ("boxes_or_types", )
+
     def __init__(self, left: Ty, box: Box, right: Ty, *more):
         if len(more) % 2:
             raise ValueError(messages.LAYERS_MUST_BE_ODD)
         self.boxes_or_types = (left, box, right) + more
-        name, dom, cod = "", left[:0], left[:0]
         for i, box_or_typ in enumerate(self.boxes_or_types):
-            if i % 2:
-                assert_isinstance(box, Box)
-                dom, cod = dom @ box_or_typ.dom, cod @ box_or_typ.cod
-                name += ("" if not name else " @ ") + str(box_or_typ)
-            else:
-                assert_isinstance(box_or_typ, Ty)
-                dom, cod = dom @ box_or_typ, cod @ box_or_typ
-                name += "" if not box_or_typ\
-                    else ("" if not name else " @ ") + str(box_or_typ)
-        super().__init__(name, dom, cod)
+            assert_isinstance(box_or_typ, Box if i % 2 else Ty)
+        doms, cods = zip(*(
+            (x.dom, x.cod) if i % 2 else (x, x) for i, x in enumerate(self)))
+        dom, cod = left[:0].tensor(*doms), left[:0].tensor(*cods)
+        self.data, self.is_dagger = None, False
+        cat.Arrow.__init__(self, (self, ), dom, cod, _scan=False)
+
+    @property
+    def name(self) -> str:
+        """ The name of a layer, computed only when needed. """
+        return " @ ".join(str(x) for i, x in enumerate(self) if i % 2 or x)
 
     def __iter__(self):
         for box_or_typ in self.boxes_or_types:
@@ -315,6 +360,11 @@ class Layer(cat.Box):
     def __eq__(self, other):
         return isinstance(other, type(self)) and tuple(self) == tuple(other)
 
+    @cached_slot
+    def _hash_box(self) -> int:
+        return hash(tuple(
+            x._hash_box if i % 2 else x for i, x in enumerate(self)))
+
     def __repr__(self):
         return factory_name(type(self))\
             + f"({', '.join(map(repr, self))})"
@@ -427,11 +477,87 @@ class Layer(cat.Box):
         return cls(*(map(from_tree, tree['inside'])))
 
 
+class Encoding:
+    """
+    A columnar encoding of a diagram: a table of boxes together with NumPy
+    arrays for the box ids, offsets and widths of each layer.
+
+    Parameters:
+        dom : The domain of the diagram.
+        table : The distinct boxes of the diagram, in order of appearance.
+        box_ids : The index in the ``table`` of the box in each layer.
+        offsets : The offset of the box in each layer.
+        widths : The number of wires at the domain of the diagram, followed
+                 by the number of wires at the codomain of each layer.
+
+    Note
+    ----
+    Encodings are computed once and cached with :attr:`Diagram.encoding`,
+    indexing them takes constant time.
+
+    Example
+    -------
+    >>> x, y = Ty('x'), Ty('y')
+    >>> f, g = Box('f', x, y), Box('g', y @ y, x)
+    >>> diagram = f @ f >> g >> f
+    >>> encoding = diagram.encoding
+    >>> assert diagram.encoding is encoding and encoding.table == (f, g)
+    >>> encoding.box_ids, encoding.offsets, encoding.widths
+    (array([0, 0, 1, 0]), array([0, 1, 0, 0]), array([2, 2, 2, 1, 1]))
+    >>> assert encoding[2] == (g, 0) and list(encoding)[:2] == [(f, 0), (f, 1)]
+    """
+    def __init__(self, dom: Ty, table: tuple[Box, ...], box_ids: "ndarray",
+                 offsets: "ndarray", widths: "ndarray"):
+        self.dom, self.table = dom, table
+        self.box_ids, self.offsets, self.widths = box_ids, offsets, widths
+
+    @classmethod
+    def from_diagram(cls, diagram: Diagram) -> Encoding:
+        """
+        Compute the encoding of a diagram with one box per layer.
+
+        Parameters:
+            diagram : The diagram to encode.
+        """
+        import numpy
+        table, ids, box_ids, offsets = [], {}, [], []
+        for left, box, _ in diagram.inside:
+            if id(box) not in ids:
+                ids[id(box)] = len(table)
+                table.append(box)
+            box_ids.append(ids[id(box)])
+            offsets.append(len(left))
+        widths = [len(diagram.dom)] + [len(layer.cod) for layer in diagram]
+        return cls(diagram.dom, tuple(table), *(
+            numpy.array(xs, dtype=int) for xs in (box_ids, offsets, widths)))
+
+    @property
+    def boxes(self) -> list[Box]:
+        """ The box in each layer of the encoded diagram. """
+        return [self.table[i] for i in self.box_ids.tolist()]
+
+    def __len__(self):
+        return len(self.box_ids)
+
+    def __getitem__(self, key: int) -> tuple[Box, int]:
+        return self.table[self.box_ids[key]], int(self.offsets[key])
+
+    def __iter__(self):
+        return zip(self.boxes, self.offsets.tolist())
+
+    def __repr__(self):
+        return factory_name(type(self)) + f"(dom={repr(self.dom)}, "\
+            f"table={repr(self.table)}, box_ids={repr(self.box_ids)}, "\
+            f"offsets={repr(self.offsets)}, widths={repr(self.widths)})"
+
+
 class Whiskerable(ABC):
     """
     Abstract class implementing the syntactic sugar :code:`@` for whiskering
     and parallel composition with some method :code:`tensor`.
     """
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def id(cls, dom: any) -> Whiskerable:
@@ -492,15 +618,20 @@ class Diagram(cat.Arrow, Whiskerable):
             normalize
             normal_form
     """
+    __slots__ = ()
+
     ty_factory = Ty
     layer_factory = Layer
 
     def __init__(
             self, inside: tuple[Layer, ...], dom: Ty, cod: Ty, _scan=True):
-        for layer in inside:
-            assert_isinstance(layer, Layer)
         super().__init__(inside, dom, cod, _scan=_scan)
 
+    def validate(self) -> None:
+        for layer in self.inside:
+            assert_isinstance(layer, Layer)
+        super().validate()
+
     def tensor(self, other: Diagram = None, *others: Diagram) -> Diagram:
         """
         Parallel composition, called using :code:`@`.
@@ -541,15 +672,23 @@ class Diagram(cat.Arrow, Whiskerable):
         dom, cod = self.dom @ other.dom, self.cod @ other.cod
         return self.factory(inside, dom, cod, _scan=False)
 
+    @cached_slot
+    def encoding(self) -> Encoding:
+        """
+        The columnar encoding of a diagram, computed once and cached in a slot
+        which is left out of the pickled state, see :class:`Encoding`.
+        """
+        return Encoding.from_diagram(self)
+
     @property
     def boxes(self) -> list[Box]:
         """ The boxes in each layer of the diagram. """
-        return list(box for _, box, _ in self)
+        return self.encoding.boxes
 
     @property
     def offsets(self) -> list[int]:
         """ The offset of a box is the length of the type on its left. """
-        return list(len(left) for left, _, _ in self)
+        return self.encoding.offsets.tolist()
 
     @property
     def width(self):
@@ -565,10 +704,15 @@ class Diagram(cat.Arrow, Whiskerable):
         """
         return max(len(self.dom), max(len(layer.cod) for layer in self))
 
-    def encode(self) -> tuple[Ty, list[tuple[Box, int]]]:
+    def encode(self, columnar=False
+               ) -> tuple[Ty, list[tuple[Box, int]]] | Encoding:
         """
         Compact encoding of a diagram as a tuple of boxes and offsets.
 
+        Parameters:
+            columnar : Whether to return the cached :class:`Encoding`
+                       rather than a list of boxes and offsets.
+
         Example
         -------
         >>> x, y, z, w = Ty('x'), Ty('y'), Ty('z'), Ty('w')
@@ -583,25 +727,85 @@ class Diagram(cat.Arrow, Whiskerable):
 
         .. image:: /_static/monoidal/arrow-example.png
             :align: center
+
+        Note
+        ----
+        The columnar encoding is computed once and shared, so that encoding
+        then decoding does not copy its arrays.
+
+        >>> encoding = diagram.encode(columnar=True)
+        >>> assert Diagram.decode(encoding).encode(columnar=True) is encoding
         """
-        return self.dom, list(zip(self.boxes, self.offsets))
+        if columnar:
+            return self.encoding
+        return self.dom, list(self.encoding)
 
     @classmethod
-    def decode(cls, dom: Ty, boxes_and_offsets: list[tuple[Box, int]]
-               ) -> Diagram:
+    def decode(cls, dom: Ty | Encoding,
+               boxes_and_offsets: list[tuple[Box, int]] = None) -> Diagram:
         """
         Turn a tuple of boxes and offsets into a diagram.
 
         Parameters:
-            dom : The domain of the diagram.
+            dom : The domain of the diagram, or its columnar encoding.
             boxes_and_offsets : The boxes and offsets of the diagram.
         """
-        diagram = cls.id(dom)
-        for box, offset in boxes_and_offsets:
-            left = diagram.cod[:offset]
-            right = diagram.cod[offset + len(box.dom):]
-            diagram = diagram >> left @ box @ right
-        return diagram
+        if isinstance(dom, Encoding):
+            encoding = dom
+            diagram = cls.from_boxes(
+                encoding.dom, encoding.boxes, encoding.offsets.tolist())
+            diagram.encoding = encoding
+            return diagram
+        boxes_and_offsets = tuple(boxes_and_offsets)
+        boxes = tuple(box for box, _ in boxes_and_offsets)
+        offsets = tuple(offset for _, offset in boxes_and_offsets)
+        return cls.from_boxes(dom, boxes, offsets)
+
+    @classmethod
+    def from_boxes(cls, dom: Ty, boxes: list[Box], offsets: list[int]
+                   ) -> Diagram:
+        """
+        Build a diagram from its domain, boxes and offsets in one pass,
+        checking that each layer composes with the previous one.
+
+        Parameters:
+            dom : The domain of the diagram.
+            boxes : The box in each layer of the diagram.
+            offsets : The offset of the box in each layer.
+
+        Raises
+        ------
+        AxiomError
+            If some box does not fit at its offset,
+            unless :func:`discopy.utils.trusted` mode is on.
+
+        Example
+        -------
+        >>> x, y = Ty('x'), Ty('y')
+        >>> f, g = Box('f', x, y), Box('g', y @ y, x)
+        >>> diagram = Diagram.from_boxes(x @ x, [f, f, g], [0, 1, 0])
+        >>> assert diagram == f @ f >> g
+        >>> Diagram.from_boxes(x @ x, [f, g], [0, 0])
+        Traceback (most recent call last):
+        ...
+        discopy.cat.AxiomError: f @ x does not compose with g: y @ x != y @ y.
+        """
+        if len(boxes) != len(offsets):
+            raise ValueError(messages.WRONG_LENGTH.format(
+                len(boxes), len(offsets)))
+        ty_factory = cls.ty_factory
+        dom = dom if isinstance(dom, ty_factory) else ty_factory(dom)
+        inside, cod = [], dom
+        for box, offset in zip(boxes, offsets):
+            layer = cls.layer_factory(
+                cod[:offset], box, cod[offset + len(box.dom):])
+            if not config.TRUSTED and (offset < 0 or layer.dom != cod):
+                previous = inside[-1] if inside else cls.id(dom)
+                raise AxiomError(messages.NOT_COMPOSABLE.format(
+                    previous, layer, cod, layer.dom))
+            inside.append(layer)
+            cod = layer.cod
+        return cls(tuple(inside), dom, cod, _scan=False)
 
     def to_drawing(self):
         """ Called before :meth:`Diagram.draw`. """
@@ -722,7 +926,7 @@ class Diagram(cat.Arrow, Whiskerable):
             return result
         if j < i:
             i, j = j, i
-        off0, off1 = self.offsets[i], self.offsets[j]
+        (_, off0), (_, off1) = self.encoding[i], self.encoding[j]
         left0, box0, right0 = self.inside[i]
         left1, box1, right1 = self.inside[j]
         # By default, we check if box0 is to the right first, then to the left.
@@ -767,8 +971,8 @@ class Diagram(cat.Arrow, Whiskerable):
         while True:
             no_more_moves = True
             for i in range(len(diagram) - 1):
-                box0, box1 = diagram.boxes[i], diagram.boxes[i + 1]
-                off0, off1 = diagram.offsets[i], diagram.offsets[i + 1]
+                (box0, off0), (box1, off1) =\
+                    diagram.encoding[i], diagram.encoding[i + 1]
                 if left and off1 >= off0 + len(box0.cod)\
                         or not left and off0 >= off1 + len(box1.dom):
                     diagram = diagram.interchange(i, i + 1, left=left)
@@ -800,6 +1004,76 @@ class Diagram(cat.Arrow, Whiskerable):
         return diagram
 
 
+class DrawingAttribute:
+    """
+    A drawing attribute of boxes, e.g. ``color``, see :class:`Box`.
+
+    Parameters:
+        name : The name of the attribute.
+        default : The default value, if any.
+
+    Note
+    ----
+    The values are kept in a dict which is only created once some drawing
+    attribute is set, so that boxes need no ``__dict__``. Setting a drawing
+    attribute takes the box out of the :func:`utils.interning` tables, so
+    that it does not change the canonical instance used elsewhere.
+
+    Example
+    -------
+    >>> x = Ty('x')
+    >>> f = Box('f', x, x, color="green")
+    >>> assert f.color == "green" and not hasattr(Box('g', x, x), "color")
+    >>> from discopy.utils import interning
+    >>> with interning():
+    ...     f_dagger = f.dagger()
+    ...     f_dagger.color = "blue"
+    ...     assert f.dagger() is not f_dagger
+    ...     assert not hasattr(f.dagger(), "color")
+    """
+    def __init__(self, name: str, *default):
+        self.name, self.default = name, default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self.default[0] if self.default else self
+        attributes = self.attributes(obj)
+        if attributes is not None and self.name in attributes:
+            return attributes[self.name]
+        if self.default:
+            return self.default[0]
+        raise AttributeError(self.name)
+
+    def __set__(self, obj, value):
+        try:
+            name, dom, cod, data, is_dagger = map(
+                partial(object.__getattribute__, obj),
+                ("name", "dom", "cod", "data", "is_dagger"))
+        except AttributeError:  # The box is not initialised yet.
+            pass
+        else:
+            uninterned(obj, name, dom, cod, data=data, is_dagger=is_dagger)
+        if self.attributes(obj) is None:
+            obj._drawing_attributes = {}
+        obj._drawing_attributes[self.name] = value
+
+    def __delete__(self, obj):
+        (self.attributes(obj) or {}).pop(self.name, None)
+
+    @staticmethod
+    def attributes(box: Box) -> dict | None:
+        """
+        The drawing attributes set on a box, if any.
+
+        Parameters:
+            box : The box.
+        """
+        try:  # Bypass __getattr__, e.g. of quantum circuits.
+            return Box._drawing_attributes.__get__(box)
+        except AttributeError:
+            return None
+
+
 class Box(cat.Box, Diagram):
     """
     A box is a diagram with a :code:`name` and the layer of just itself inside.
@@ -839,11 +1113,20 @@ class Box(cat.Box, Diagram):
     >>> assert Id(Ty()) @ f == f == f @ Id(Ty())
     >>> assert f == f[::-1][::-1]
     """
+    __slots__ = ("_drawing_attributes", )
     __ambiguous_inheritance__ = (cat.Box, )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attr in drawing.ATTRIBUTES:
+            value = cls.__dict__.get(attr, None)
+            if attr in cls.__dict__ and not isinstance(
+                    value, (DrawingAttribute, property)):
+                setattr(cls, attr, DrawingAttribute(attr, value))
+
     def to_drawing(self) -> Box:
         dom, cod = self.dom.to_drawing(), self.cod.to_drawing()
-        result = Box(self.name, dom, cod, is_dagger=self.is_dagger)
+        result = DrawingBox(self.name, dom, cod, is_dagger=self.is_dagger)
         for attr, default in drawing.ATTRIBUTES.items():
             setattr(result, attr, getattr(self, attr, default(result)))
         return result
@@ -863,8 +1146,22 @@ class Box(cat.Box, Diagram):
         return isinstance(other, self.factory)\
             and other.inside == (self.layer_factory.cast(self), )
 
-    def __hash__(self):
-        return hash(repr(self))
+    __hash__ = Diagram.__hash__
+
+
+for attr in (*drawing.ATTRIBUTES, "_apply"):  # See drawing.diagramize.
+    setattr(Box, attr, DrawingAttribute(attr))
+
+
+class DrawingBox(Box):
+    """
+    A box in a drawing, i.e. the output of :meth:`Box.to_drawing`.
+
+    Note
+    ----
+    Plain boxes have ``__slots__``, drawing boxes have a ``__dict__`` so they
+    can carry extra attributes, e.g. ``bubble_opening``.
+    """
 
 
 class Sum(cat.Sum, Box):
@@ -929,7 +1226,7 @@ class Bubble(cat.Bubble, Box):
     def to_drawing(self):
         dom, cod = self.dom.to_drawing(), self.cod.to_drawing()
         argdom, argcod = self.arg.dom.to_drawing(), self.arg.cod.to_drawing()
-        left, right = Ty(self.drawing_name), Ty("")
+        left, right = Ty(DrawingOb(self.drawing_name)), Ty(DrawingOb(""))
         left.inside[0].always_draw_label = True
         _open = Box("_open", dom, left @ argdom @ right).to_drawing()
         _close = Box("_close", left @ argcod @ right, cod).to_drawing()
@@ -992,7 +1289,7 @@ class Functor(cat.Functor):
         if isinstance(other, PRO):
             return sum(other.n * [self.ob[other.factory(1)]], self.cod.ob())
         if isinstance(other, Ty):
-            return sum(map(self, other.inside), self.cod.ob())
+            return sum(map(self._memoized_call, other.inside), self.cod.ob())
         if isinstance(other, cat.Ob):
             result = self.ob[self.dom.ob(other)]
             dtype = getattr(self.cod.ob, "__origin__", self.cod.ob)
@@ -1001,9 +1298,9 @@ class Functor(cat.Functor):
                 (result, ) if dtype == tuple else self.cod.ob(result)
         if isinstance(other, Layer):
             head, *tail = other
-            result = self(head)
+            result = self._memoized_call(head)
             for box_or_typ in tail:
-                result = result @ self(box_or_typ)
+                result = result @ self._memoized_call(box_or_typ)
             return result
         return super().__call__(other)
 
@@ -69,6 +69,8 @@ class Ob(rigid.Ob):
         name : The name of the object.
         z (bool) : Whether the object is an adjoint or not.
     """
+    __slots__ = ()
+
     l = r = property(lambda self: type(self)(self.name, (self.z + 1) % 2))
 
 
@@ -80,6 +82,8 @@ class Ty(rigid.Ty):
     Parameters:
         inside (Ob) : The objects inside the type.
     """
+    __slots__ = ()
+
     ob_factory = Ob
 
 
@@ -94,6 +98,8 @@ class Diagram(rigid.Diagram, traced.Diagram):
         dom (Ty) : The domain of the diagram, i.e. its input.
         cod (Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     ty_factory = Ty
 
     def dagger(self):
@@ -179,6 +185,8 @@ class Box(rigid.Box, Diagram):
         dom (Ty) : The domain of the box, i.e. its input.
         cod (Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (rigid.Box, )
 
     def rotate(self, left=False):
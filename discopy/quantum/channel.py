@@ -88,7 +88,7 @@ class CQ:
             and self.quantum == other.quantum
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.classical, self.quantum))
 
     def __repr__(self):
         return f"CQ(classical={self.classical}, quantum={self.quantum})"
@@ -313,6 +313,8 @@ class Functor(tensor.Functor):
             return Q(Dim(other.dim))
         if not isinstance(other, Box):
             return frobenius.Functor.__call__(self, other)
+        if other.is_dagger:  # e.g. S.dagger(), with the array of S.
+            return self(other.dagger()).dagger()
         if isinstance(other, Discard):
             return self.cod.ar.discard(self(other.dom))
         if isinstance(other, Measure):
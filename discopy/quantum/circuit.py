@@ -72,7 +72,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from math import pi
 
-from discopy import messages, rigid, tensor, frobenius
+from discopy import matrix, messages, rigid, tensor, frobenius
 from discopy.cat import factory, Category
 from discopy.matrix import backend
 from discopy.tensor import Dim, Tensor
@@ -93,6 +93,8 @@ class Ob(frobenius.Ob):
     :class:`Qudit`, but feel free to open a pull-request if you discover a
     third kind of information unit.
     """
+    __slots__ = ("dim", )
+
     def __init__(self, name: str, dim=2, z=0):
         assert_isinstance(dim, int)
         assert_isinstance(self, (Digit, Qudit))
@@ -116,6 +118,8 @@ class Digit(Ob):
     --------
     >>> assert bit.inside == (Digit(2),)
     """
+    __slots__ = ()
+
     def __init__(self, dim: int, z=0):
         name = "bit" if dim == 2 else f"Digit({dim})"
         super().__init__(name, dim)
@@ -132,6 +136,8 @@ class Qudit(Ob):
     --------
     >>> assert qubit.inside == (Qudit(2),)
     """
+    __slots__ = ()
+
     def __init__(self, dim, z=0):
         name = "qubit" if dim == 2 else f"Qudit({dim})"
         super().__init__(name, dim)
@@ -157,6 +163,8 @@ class Ty(frobenius.Ty):
     >>> print(bit ** 2 @ qubit ** 3)
     bit @ bit @ qubit @ qubit @ qubit
     """
+    __slots__ = ()
+
     ob_factory = Ob
 
 
@@ -170,6 +178,8 @@ class Circuit(tensor.Diagram):
         dom (quantum.circuit.Ty) : The domain of the circuit diagram.
         cod (quantum.circuit.Ty) : The codomain of the circuit diagram.
     """
+    __slots__ = ()
+
     ty_factory = Ty
 
     @classmethod
@@ -214,7 +224,7 @@ class Circuit(tensor.Diagram):
         return circuit
 
     def eval(self, *others, backend=None, mixed=False,
-             contractor=None, **params):
+             contractor=None, precision=None, simulator=None, **params):
         """
         Evaluate a circuit on a backend, or simulate it with numpy.
 
@@ -231,6 +241,15 @@ class Circuit(tensor.Diagram):
         contractor : callable, optional
             Use :class:`tensornetwork` contraction
             instead of discopy's basic eval feature.
+        precision : str, optional
+            The name of a dtype policy for the simulation of pure circuits,
+            see :class:`discopy.matrix.Precision`.
+        simulator : str, optional
+            The name of a simulator, e.g. :code:`"statevector"` for pure
+            circuits, :code:`"density_matrix"` for mixed circuits or
+            :code:`"stabilizer"` for Clifford circuits from no inputs to
+            bits, to use instead of a functor, see
+            :mod:`discopy.quantum.simulator`.
         params : kwargs, optional
             Get passed to Circuit.get_counts.
 
@@ -253,6 +272,13 @@ class Circuit(tensor.Diagram):
         >>> H.eval(mixed=True).round(1)  # doctest: +ELLIPSIS
         Channel([0.5+0.j, ..., 0.5+0.j], dom=Q(Dim(2)), cod=Q(Dim(2)))
 
+        We can simulate in single precision, or store the gates in single
+        precision and contract them in double precision:
+
+        >>> H.eval(precision="single").round(2)  # doctest: +ELLIPSIS
+        Tensor[complex64]([0.71+0.j, ..., -0.71+0.j], dom=Dim(2), cod=Dim(2))
+        >>> assert H.eval(precision="mixed").is_close(H.eval())
+
         We can evaluate a mixed circuit as a :class:`Channel`:
 
         >>> from discopy.quantum import Channel
@@ -271,6 +297,20 @@ class Circuit(tensor.Diagram):
         ...     == Tensor[complex](dom=Dim(1), cod=Dim(2), array=[0., 1.])
         """
         from discopy.quantum import channel
+        if precision is not None:
+            with matrix.precision(precision):
+                return self.eval(*others, backend=backend, mixed=mixed,
+                                 contractor=contractor, simulator=simulator,
+                                 **params)
+        if simulator is not None and backend is None:
+            from discopy.quantum.simulator import SIMULATORS
+            if simulator not in SIMULATORS:
+                raise ValueError(messages.UNKNOWN_SIMULATOR.format(simulator))
+            if mixed and simulator == "statevector":
+                raise ValueError(messages.NOT_PURE.format(self))
+            results = [SIMULATORS[simulator](circuit)
+                       for circuit in (self, ) + others]
+            return results if others else results[0]
         if contractor is not None:
             array = contractor(*self.to_tn(mixed=mixed)).tensor
             if self.is_mixed or mixed:
@@ -294,7 +334,7 @@ class Circuit(tensor.Diagram):
                 lambda x: x.inside[0].dim,
                 lambda f: f.array,
                 dom=Category(Ty, Circuit),
-                dtype=complex)(self)
+                dtype=complex).compile(self)()
         circuits = [circuit.to_tk() for circuit in (self, ) + others]
         results, counts = [], circuits[0].get_counts(
             *circuits[1:], backend=backend, **params)
@@ -308,6 +348,48 @@ class Circuit(tensor.Diagram):
             results.append(result)
         return results if len(results) > 1 else results[0]
 
+    def estimate_cost(self, strategy="functor", mixed=False):
+        """
+        Estimate the cost of simulating a circuit from its shape only,
+        see :meth:`discopy.tensor.Diagram.estimate_cost`.
+
+        Parameters
+        ----------
+        strategy : str, optional
+            Either :code:`"functor"` or a strategy for the einsum path.
+        mixed : bool, optional
+            Whether to estimate the cost of :class:`ChannelFunctor`, i.e.
+            with every qudit wire doubled.
+
+        Returns
+        -------
+        cost : dict[str, int]
+            The number of :code:`flops`, the size of the largest intermediate
+            :code:`peak` and the largest :code:`rank` of any tensor.
+
+        Examples
+        --------
+        >>> from discopy.quantum import *
+        >>> circuit = H @ qubit >> CX
+        >>> circuit.estimate_cost()
+        {'flops': 96, 'peak': 16, 'rank': 4}
+        >>> circuit.estimate_cost("greedy")
+        {'flops': 32, 'peak': 16, 'rank': 4}
+        >>> circuit.estimate_cost(mixed=True)
+        {'flops': 5120, 'peak': 256, 'rank': 8}
+        """
+        mixed = mixed or self.is_mixed
+
+        def ob(x):
+            dim = x.inside[0].dim
+            return Dim(dim, dim) if mixed and isinstance(x.inside[0], Qudit)\
+                else Dim(dim)
+        shape = frobenius.Functor(
+            ob, lambda f: tensor.Box(f.name, shape(f.dom), shape(f.cod)),
+            cod=Category(Dim, tensor.Diagram))
+        shape.dom = Category(Ty, Circuit)
+        return shape(self).estimate_cost(strategy)
+
     def get_counts(self, *others, backend=None, **params):
         """
         Get counts from a backend, or simulate them with numpy.
@@ -317,7 +399,8 @@ class Circuit(tensor.Diagram):
         others : :class:`discopy.quantum.circuit.Circuit`
             Other circuits to process in batch.
         backend : pytket.Backend, optional
-            Backend on which to run the circuit, if none then `numpy`.
+            Backend on which to run the circuit, if none then `numpy` with
+            :func:`discopy.quantum.simulator.density_matrix`.
         n_shots : int, optional
             Number of shots, default is :code:`2**10`.
         measure_all : bool, optional
@@ -351,41 +434,45 @@ class Circuit(tensor.Diagram):
             if others:
                 return [circuit.get_counts(**params)
                         for circuit in (self, ) + others]
-            result, counts = self.init_and_discard().eval(mixed=True), dict()
-            for i in range(2 ** len(result.cod.classical)):
-                bits = index2bitstring(i, len(result.cod.classical))
-                if result.array[bits]:
-                    counts[bits] = result.array[bits].real
-            return counts
+            result = self.init_and_discard().eval(
+                mixed=True, simulator="density_matrix")
+            with matrix.backend() as np:
+                array = np.real(result.array).reshape(
+                    result.cod.classical.inside)
+                return dict(zip(
+                    map(tuple, np.argwhere(array).tolist()),
+                    array.reshape(-1)[np.flatnonzero(array)].tolist()))
         counts = self.to_tk().get_counts(
             *(other.to_tk() for other in others), backend=backend, **params)
         return counts if len(counts) > 1 else counts[0]
 
     def measure(self, mixed=False):
         """
-        Measure a circuit on the computational basis using :code:`numpy`.
+        Measure a circuit on the computational basis using :code:`numpy`,
+        i.e. take the squared amplitudes of the whole state at once.
 
         Parameters
         ----------
         mixed : Whether to apply a :class:`tensor.Functor`
-                or a :class:`channel.Functor`.
+                or the :func:`discopy.quantum.simulator.density_matrix`.
 
         Returns
         -------
         array : numpy.ndarray
+
+        Example
+        -------
+        >>> from discopy.quantum import H, X, CX
+        >>> (H @ X >> CX).measure().real.round(2).tolist()
+        [[0.0, 0.5], [0.5, 0.0]]
         """
-        from discopy.quantum.gates import Bra, Ket
+        from discopy.quantum.gates import Ket
         if mixed or self.is_mixed:
-            return self.init_and_discard().eval(mixed=True).array.real
+            return self.init_and_discard().eval(
+                mixed=True, simulator="density_matrix").array.real
         state = (Ket(*(len(self.dom) * [0])) >> self).eval()
-        effects = [Bra(*index2bitstring(j, len(self.cod))).eval()
-                   for j in range(2 ** len(self.cod))]
         with backend() as np:
-            array = np.zeros(len(self.cod) * (2, )) + 0j
-            for effect in effects:
-                array +=\
-                    effect.array * np.absolute((state >> effect).array) ** 2
-        return array
+            return np.absolute(state.array) ** 2 + 0j
 
     def to_tn(self, mixed=False):
         """
@@ -788,15 +875,14 @@ class Box(tensor.Box, Circuit):
         data : The array inside the box.
         is_mixed : Whether the box is mixed.
     """
+    __slots__ = ("_is_mixed", )
+
     def __init__(self, name: str, dom: Ty, cod: Ty,
                  data=None, is_mixed=True, **params):
-        if not is_mixed:
-            if all(isinstance(x, Digit) for x in (dom @ cod).inside):
-                self.is_classical = True
-            elif all(isinstance(x, Qudit) for x in (dom @ cod).inside):
-                self.is_classical = False
-            else:
-                raise ValueError(messages.BOX_IS_MIXED)
+        if not is_mixed and not any(
+                all(isinstance(x, cls) for x in (dom @ cod).inside)
+                for cls in (Digit, Qudit)):
+            raise ValueError(messages.BOX_IS_MIXED)
         self._is_mixed = is_mixed
         tensor.Box.__init__(self, name, dom, cod, data=data, **params)
 
@@ -817,6 +903,12 @@ class Box(tensor.Box, Circuit):
     def is_mixed(self):
         return self._is_mixed
 
+    @property
+    def is_classical(self):
+        """ Whether the box is pure with only bits as inputs and outputs. """
+        return not self.is_mixed and all(
+            isinstance(x, Digit) for x in (self.dom @ self.cod).inside)
+
     def dagger(self):
         return self if self.is_dagger is None else super().dagger()
 
@@ -70,6 +70,8 @@ def format_number(data):
 
 class SelfConjugate(Box):
     """ A self-conjugate box, i.e. where the transpose is the dagger. """
+    __slots__ = ()
+
     def conjugate(self):
         return self
 
@@ -80,6 +82,8 @@ class SelfConjugate(Box):
 
 class AntiConjugate(Box):
     """ An anti-conjugate box, i.e. where the conjugate is the dagger. """
+    __slots__ = ()
+
     def conjugate(self):
         return self.dagger()
 
@@ -92,6 +96,8 @@ class Discard(SelfConjugate):
     """
     Discard n qubits. If :code:`dom == bit` then marginal distribution.
     """
+    __slots__ = ("n_qubits", )
+
     draw_as_discards = True
 
     def __init__(self, dom=1):
@@ -113,6 +119,8 @@ class MixedState(SelfConjugate):
     Maximally-mixed state on n qubits.
     If :code:`cod == bit` then uniform distribution.
     """
+    __slots__ = ()
+
     draw_as_discards = True
 
     def __init__(self, cod=1):
@@ -145,6 +153,8 @@ class Measure(SelfConjugate):
     override_bits : bool, optional
         Whether to override input bits, this is the standard behaviour of tket.
     """
+    __slots__ = ("destructive", "override_bits", "n_qubits")
+
     draw_as_measures = True
 
     def __init__(self, n_qubits=1, destructive=True, override_bits=False):
@@ -161,7 +171,6 @@ class Measure(SelfConjugate):
         super().__init__(name, dom, cod, is_mixed=True)
         self.destructive, self.override_bits = destructive, override_bits
         self.n_qubits = n_qubits
-        self.draw_as_measures = True
 
     def dagger(self):
         return Encode(self.n_qubits,
@@ -187,6 +196,8 @@ class Encode(SelfConjugate):
     reset_bits : bool, optional
         Whether to reset the bits to the uniform distribution.
     """
+    __slots__ = ("constructive", "reset_bits", "n_bits")
+
     draw_as_measures = True
 
     def __init__(self, n_bits=1, constructive=True, reset_bits=False):
@@ -212,6 +223,8 @@ class Encode(SelfConjugate):
 
 class QuantumGate(Box):
     """ Quantum gates, i.e. unitaries on n qubits. """
+    __slots__ = ()
+
     is_mixed = False
     is_classical = False
 
@@ -228,16 +241,20 @@ class ClassicalGate(SelfConjugate):
     >>> f.lambdify(*array)(1, 2, 3, 4).data
     (1, 2, 3, 4)
     """
+    __slots__ = ()
+
     is_mixed = False
     is_classical = True
 
 
 class Copy(ClassicalGate):
     """ Takes a bit, returns two copies of it. """
+    __slots__ = ()
+
+    draw_as_spider, color, drawing_name = True, "black", ""
+
     def __init__(self):
         super().__init__("Copy", bit, bit ** 2, [1, 0, 0, 0, 0, 0, 0, 1])
-        self.draw_as_spider, self.color = True, "black"
-        self.drawing_name = ""
 
     def dagger(self):
         return Match()
@@ -245,10 +262,12 @@ class Copy(ClassicalGate):
 
 class Match(ClassicalGate):
     """ Takes two bits in, returns them if they are equal. """
+    __slots__ = ()
+
+    draw_as_spider, color, drawing_name = True, "black", ""
+
     def __init__(self):
         super().__init__("Match", bit ** 2, bit, [1, 0, 0, 0, 0, 0, 0, 1])
-        self.draw_as_spider, self.color = True, "black"
-        self.drawing_name = ""
 
     def dagger(self):
         return Copy()
@@ -263,6 +282,8 @@ class Digits(ClassicalGate):
     >>> assert Digits(2, dim=4).eval()\\
     ...     == Tensor[complex](dom=Dim(1), cod=Dim(4), array=[0, 0, 1, 0])
     """
+    __slots__ = ("_digits", "_dim")
+
     draw_as_brakets = True
 
     def __init__(self, *digits, dim=None, is_dagger=False):
@@ -323,6 +344,9 @@ class Ket(SelfConjugate, QuantumGate):
     >>> assert Ket(1, 0).eval()\\
     ...     == Tensor[complex](dom=Dim(1), cod=Dim(2, 2), array=[0, 0, 1, 0])
     """
+    __slots__ = ("_digits", "_dim")
+
+    draw_as_brakets = True
     to_drawing = Digits.to_drawing
     array = Digits.array
 
@@ -333,7 +357,7 @@ class Ket(SelfConjugate, QuantumGate):
         dom, cod = qubit ** 0, qubit ** len(bitstring)
         name = f"Ket({', '.join(map(str, bitstring))})"
         super().__init__(name, dom, cod)
-        self._digits, self._dim, self.draw_as_brakets = bitstring, 2, True
+        self._digits, self._dim = bitstring, 2
 
     @property
     def bitstring(self):
@@ -355,6 +379,9 @@ class Bra(SelfConjugate, QuantumGate):
     >>> assert Bra(1, 0).eval()\\
     ...     == Tensor[complex](dom=Dim(2, 2), cod=Dim(1), array=[0, 0, 1, 0])
     """
+    __slots__ = ("_digits", "_dim")
+
+    draw_as_brakets = True
     to_drawing = Digits.to_drawing
     array = Digits.array
 
@@ -365,7 +392,7 @@ class Bra(SelfConjugate, QuantumGate):
         name = f"Bra({', '.join(map(str, bitstring))})"
         dom, cod = qubit ** len(bitstring), qubit ** 0
         super().__init__(name, dom, cod)
-        self._digits, self._dim, self.draw_as_brakets = bitstring, 2, True
+        self._digits, self._dim = bitstring, 2
 
     @property
     def bitstring(self):
@@ -391,6 +418,8 @@ class Controlled(QuantumGate):
         Number of qubits from the control to the target, default is :code:`0`.
         If negative, the control is on the right of the target.
     """
+    __slots__ = ("controlled", "distance")
+
     draw_as_controlled = True
 
     def __init__(self, controlled, distance=1):
@@ -514,10 +543,16 @@ class Parametrized(Box):
     >>> c = Rz(phi) >> Rz(-phi)
     >>> assert c.lambdify(phi)(.25) == Rz(.25) >> Rz(-.25)
     """
+    __slots__ = ()
+
     def __init__(self, name, dom, cod, data=None, **params):
-        self.drawing_name = f'{name}({data})'
         Box.__init__(self, name, dom, cod, data=data, **params)
 
+    @property
+    def drawing_name(self):
+        """ The name of the box in drawings, with its parameters. """
+        return f'{self.name}({self.data})'
+
     @property
     def modules(self):
         if self.free_symbols:
@@ -548,6 +583,8 @@ class Parametrized(Box):
 
 class Rotation(Parametrized, QuantumGate):
     """ Abstract class for rotation gates. """
+    __slots__ = ()
+
     n_qubits = 1
 
     def __init__(self, phase, z=0):
@@ -588,6 +625,8 @@ class Rotation(Parametrized, QuantumGate):
 
 class Rx(AntiConjugate, Rotation):
     """ X rotations. """
+    __slots__ = ()
+
     @property
     def array(self):
         with backend() as np:
@@ -599,6 +638,8 @@ class Rx(AntiConjugate, Rotation):
 
 class Ry(SelfConjugate, Rotation):
     """ Y rotations. """
+    __slots__ = ()
+
     @property
     def array(self):
         with backend() as np:
@@ -610,6 +651,8 @@ class Ry(SelfConjugate, Rotation):
 
 class Rz(AntiConjugate, Rotation):
     """ Z rotations. """
+    __slots__ = ()
+
     @property
     def array(self):
         with backend() as np:
@@ -622,6 +665,8 @@ class Rz(AntiConjugate, Rotation):
 
 class U1(AntiConjugate, Rotation):
     """ Z rotation, differ from :class:`Rz` by a global phase. """
+    __slots__ = ()
+
     @property
     def array(self):
         with backend() as np:
@@ -632,6 +677,8 @@ class U1(AntiConjugate, Rotation):
 
 class ControlledRotation(Controlled, Rotation):
     """ Controlled rotation gate. """
+    drawing_name = property(lambda self: self.name)
+
     def __init__(self, phase, distance=1):
         Controlled.__init__(self, self.controlled(phase), distance)
 
@@ -656,8 +703,9 @@ class CRx(ControlledRotation):
 
 class Scalar(Parametrized):
     """ Scalar, i.e. quantum gate with empty domain and codomain. """
+    __slots__ = ()
+
     def __init__(self, data, name=None, is_mixed=False):
-        self.drawing_name = format_number(data)
         name = "scalar" if name is None else name
         dom, cod = qubit ** 0, qubit ** 0
         super().__init__(name, dom, cod, is_mixed=is_mixed, data=data, z=None)
@@ -682,15 +730,22 @@ class Scalar(Parametrized):
 
 class MixedScalar(Scalar):
     """ Mixed scalar, i.e. where the Born rule has already been applied. """
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data, is_mixed=True)
 
 
 class Sqrt(Scalar):
     """ Square root. """
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data, name="sqrt")
-        self.drawing_name = f"sqrt({format_number(data)})"
+
+    @property
+    def drawing_name(self):
+        return f"sqrt({format_number(self.data)})"
 
     @property
     def array(self):
@@ -0,0 +1,675 @@
+# -*- coding: utf-8 -*-
+
+"""
+Simulators for quantum circuits, i.e. evaluation engines which apply each
+gate in turn to a state rather than contracting a tensor network.
+
+Summary
+-------
+
+.. autosummary::
+    :template: class.rst
+    :nosignatures:
+    :toctree:
+
+    Tableau
+
+.. admonition:: Functions
+
+    .. autosummary::
+        :template: function.rst
+        :nosignatures:
+        :toctree:
+
+        statevector
+        density_matrix
+        is_clifford
+        stabilizer
+        stabilizer_probability
+        stabilizer_counts
+
+Example
+-------
+>>> from discopy.quantum import Ket, H, CX, Measure, qubit
+>>> circuit = Ket(0, 0) >> H @ qubit >> CX
+>>> statevector(circuit).round(2)  # doctest: +ELLIPSIS
+Tensor[complex]([0.71+0.j, ..., 0.71+0.j], dom=Dim(1), cod=Dim(2, 2))
+>>> assert circuit.eval(simulator="statevector") == statevector(circuit)
+>>> noisy = circuit >> Measure(2)
+>>> assert noisy.eval(simulator="density_matrix").is_close(noisy.eval())
+"""
+
+from __future__ import annotations
+
+from discopy import messages
+from discopy.cat import Category
+from discopy.matrix import get_precision
+from discopy.quantum.channel import Channel, Functor
+from discopy.quantum.circuit import Circuit, Ty, Qudit, Sum, Swap
+from discopy.quantum.gates import (
+    Ket, Bra, Digits, Discard, MixedState, Measure, Encode, Scalar,
+    Controlled, Rx, Ry, Rz, H, S, X, Y, Z)
+from discopy.tensor import Dim, Tensor
+from discopy.utils import product
+
+
+def dims(typ: Ty) -> list[int]:
+    """ The dimension of each wire in a circuit type. """
+    return [obj.dim for obj in typ.inside]
+
+
+def _matrix(box, dtype):
+    """
+    The matrix of a pure box from its inputs to its outputs, i.e. the
+    conjugate transpose of that of its dagger if the box is a dagger.
+    """
+    import numpy
+    n_dom, n_cod = product(dims(box.dom)), product(dims(box.cod))
+    if box.is_dagger:
+        return numpy.asarray(box.dagger().array, dtype).reshape(
+            n_cod, n_dom).conjugate()
+    return numpy.asarray(box.array, dtype).reshape(n_dom, n_cod).T
+
+
+def _apply(view, box, dtype, chunk_size, conjugate=False):
+    """
+    Apply a pure box to a view of shape ``(left, dom, right)`` of the state,
+    in place if the box is square, returning the new state.
+    """
+    import numpy
+    left, _, right = view.shape
+    n_dom, n_cod = dims(box.dom), dims(box.cod)
+    if isinstance(box, (Ket, Bra, Digits)) and not box.dom:
+        state = numpy.zeros((left, product(n_cod), right), dtype)
+        state[:, numpy.ravel_multi_index(box.bitstring, n_cod)] = view[:, 0]
+        return state
+    if isinstance(box, (Ket, Bra, Digits)) and not box.cod:
+        return numpy.ascontiguousarray(
+            view[:, numpy.ravel_multi_index(box.bitstring, n_dom)])
+    matrix = _matrix(box, dtype)
+    matrix = matrix.conjugate() if conjugate else matrix
+    if n_dom != n_cod:
+        return numpy.matmul(matrix, view)
+    size, narrow = len(matrix), right < 16
+    if narrow:  # One matrix product rather than many tiny ones.
+        matrix = numpy.kron(matrix, numpy.identity(right, dtype)).T
+    step_right = right if narrow else min(right, max(1, chunk_size // size))
+    step_left = max(1, chunk_size // (size * step_right))
+    for i in range(0, left, step_left):
+        for j in range(0, right, step_right):
+            chunk = view[i:i + step_left, :, j:j + step_right]
+            if narrow:
+                chunk = chunk.reshape(len(chunk), size * right)
+                chunk[...] = numpy.matmul(chunk, matrix)
+            else:
+                chunk[...] = numpy.matmul(matrix, chunk)
+    return view
+
+
+def statevector(circuit: Circuit, chunk_size: int = 2 ** 20) -> Tensor:
+    """
+    Simulate a pure circuit by applying each box in turn to a state of shape
+    ``circuit.dom @ wires``, starting from the identity on ``circuit.dom``.
+
+    Kets extend the state and bras post-select it, swaps permute its axes,
+    boxes with as many inputs as outputs are applied in place to strided
+    views of the state, one chunk at a time, and any other box is applied
+    as a matrix from its inputs to its outputs.
+
+    Parameters:
+        circuit : The pure circuit to simulate.
+        chunk_size : The number of entries updated at once in place, i.e. the
+            size of the temporary buffer.
+
+    Note
+    ----
+    The state is ``complex`` or ``complex64`` in single precision, see
+    :class:`discopy.matrix.Precision`.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, Bra, H, CX, qubit
+    >>> bell = Ket(0, 0) >> H @ qubit >> CX >> Bra(0) @ qubit
+    >>> statevector(bell).round(2)
+    Tensor[complex]([0.71+0.j, 0. +0.j], dom=Dim(1), cod=Dim(2))
+    >>> assert statevector(CX).is_close(CX.eval())
+    """
+    import numpy
+    dtype = get_precision().accumulation_dtype(complex)
+    if isinstance(circuit, Sum):
+        return sum((statevector(term, chunk_size) for term in circuit.terms),
+                   Tensor[dtype].zero(Dim(*dims(circuit.dom)),
+                                      Dim(*dims(circuit.cod))))
+    if circuit.is_mixed:
+        raise ValueError(messages.NOT_PURE.format(circuit))
+    wires, batch = dims(circuit.dom), product(dims(circuit.dom))
+    state = numpy.identity(batch, dtype)
+    for box, off in zip(circuit.boxes, circuit.offsets):
+        n_dom, n_cod = dims(box.dom), dims(box.cod)
+        left = batch * product(wires[:off])
+        right = product(wires[off + len(n_dom):])
+        view = state.reshape(left, product(n_dom), right)
+        if isinstance(box, Swap):
+            state = view.reshape(left, *n_dom, right).transpose(0, 2, 1, 3)
+            state = numpy.ascontiguousarray(state)
+        else:
+            state = _apply(view, box, dtype, chunk_size)
+        wires[off:off + len(n_dom)] = n_cod
+    return Tensor[dtype](
+        state, Dim(*dims(circuit.dom)), Dim(*dims(circuit.cod)))
+
+
+def _diagonal(box) -> tuple[list[int], list[int], list[int], list[int]]:
+    """
+    The einsum labels ``(dom_ket, dom_bra, cod_ket, cod_bra)`` of a discard,
+    a measurement or their daggers, starting at ``3`` for each qudit.
+    """
+    if isinstance(box, (MixedState, Encode)):
+        dom_ket, dom_bra, cod_ket, cod_bra = _diagonal(box.dagger())
+        return cod_ket, cod_bra, dom_ket, dom_bra
+    n_dom = len(box.dom)
+    if isinstance(box, Discard):
+        labels = list(range(3, 3 + n_dom))
+        return labels, [
+            i for i, obj in zip(labels, box.dom.inside)
+            if isinstance(obj, Qudit)], [], []
+    qudits = list(range(3, 3 + box.n_qubits))
+    digits = list(range(3 + box.n_qubits, 3 + n_dom))
+    dom_ket = qudits + digits if box.override_bits else qudits
+    if box.destructive:
+        return dom_ket, qudits, qudits, []
+    return dom_ket, qudits, qudits + qudits, qudits
+
+
+def _classical_first(labels, quantum: list[bool]) -> list:
+    """ The labels of classical wires followed by those of quantum wires. """
+    return [i for i, q in zip(labels, quantum) if not q]\
+        + [i for i, q in zip(labels, quantum) if q]
+
+
+def _einsum(view, inputs, output, sizes, dtype):
+    """
+    Like :code:`numpy.einsum` but where repeated labels in the output are
+    written on the diagonal and labels missing from the inputs are broadcast.
+    """
+    import numpy
+    unique = list(dict.fromkeys(output))
+    value = numpy.einsum(view, inputs, [x for x in unique if x in inputs])
+    value = value.reshape([sizes[x] if x in inputs else 1 for x in unique])
+    result = numpy.zeros([sizes[x] for x in output], dtype)
+    target = result if len(unique) == len(output)\
+        else numpy.einsum(result, output, unique)
+    target[...] = value
+    return result
+
+
+def density_matrix(circuit: Circuit, chunk_size: int = 2 ** 20) -> Channel:
+    """
+    Simulate a mixed circuit by applying each box in turn to a state with one
+    axis for each digit and two axes for each qudit, starting from the
+    identity channel on ``circuit.dom``.
+
+    Pure quantum boxes are applied as :math:`U \\rho U^\\dagger` in place,
+    i.e. :math:`U` on the ket axes then :math:`\\overline{U}` on the bra axes,
+    classical boxes are applied to the digit axes only, measurements and
+    discards take diagonals and partial traces of the state and their daggers
+    write on the diagonal of a fresh state. Any other mixed box is contracted
+    with its :class:`Channel` array.
+
+    Parameters:
+        circuit : The circuit to simulate.
+        chunk_size : The number of entries updated at once in place, see
+            :func:`statevector`.
+
+    Note
+    ----
+    This never builds the doubled tensor network of :meth:`Channel.double`,
+    so that the peak memory is the size of the density matrix itself.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, H, CX, Measure, Discard, qubit
+    >>> circuit = Ket(0, 0) >> H @ qubit >> CX >> Measure() @ Discard()
+    >>> density_matrix(circuit).round(2)
+    Channel([0.5+0.j, 0.5+0.j], dom=CQ(), cod=Q(Dim(2)))
+    >>> assert density_matrix(circuit).is_close(circuit.eval(mixed=True))
+    """
+    import numpy
+    dtype = get_precision().accumulation_dtype(complex)
+    functor = Functor({}, {}, dom=Category(Ty, Circuit), dtype=dtype)
+    dom, cod = functor(circuit.dom), functor(circuit.cod)
+    if isinstance(circuit, Sum):
+        return sum((density_matrix(term, chunk_size)
+                    for term in circuit.terms), Channel[dtype](numpy.zeros(
+                        (dom.to_dim() @ cod.to_dim()).inside, dtype),
+                        dom, cod))
+    wires, batch = dims(circuit.dom), product(dom.to_dim().inside)
+    quantum = [isinstance(obj, Qudit) for obj in circuit.dom.inside]
+    order = _classical_first(range(len(wires)), quantum)
+    state = numpy.identity(batch, dtype).reshape(
+        batch, *dom.to_dim().inside).transpose(
+            0, *[1 + order.index(i) for i in range(len(wires))],
+            *range(1 + len(wires), 1 + len(wires) + sum(quantum)))
+    state = numpy.ascontiguousarray(state)
+    for box, off in zip(circuit.boxes, circuit.offsets):
+        n_dom, n_cod = dims(box.dom), dims(box.cod)
+        q_dom = [isinstance(obj, Qudit) for obj in box.dom.inside]
+        q_cod = [isinstance(obj, Qudit) for obj in box.cod.inside]
+        bra = [dim for dim, q in zip(wires, quantum) if q]
+        bra_dom = [dim for dim, q in zip(n_dom, q_dom) if q]
+        q_off = sum(quantum[:off])
+        left = batch * product(wires[:off])
+        mid = product(wires[off + len(n_dom):]) * product(bra[:q_off])
+        right = product(bra[q_off + len(bra_dom):])
+        if isinstance(box, Swap):
+            axes = [0, 2, 1, 3] + ([5, 4, 6] if all(q_dom)
+                                   else list(range(4, 5 + len(bra_dom))))
+            state = state.reshape(left, *n_dom, mid, *bra_dom, right)
+            state = numpy.ascontiguousarray(state.transpose(axes))
+        elif isinstance(box, Scalar):
+            state = state * (
+                box.array if box.is_mixed else abs(box.array) ** 2)
+        elif not box.is_mixed:
+            state = _apply(state.reshape(
+                left, product(n_dom), mid * product(bra_dom) * right),
+                box, dtype, chunk_size)
+            if not box.is_classical:
+                state = _apply(state.reshape(
+                    left * product(n_cod) * mid, product(bra_dom), right),
+                    box, dtype, chunk_size, conjugate=True)
+        elif isinstance(box, (Discard, MixedState, Measure, Encode)):
+            dom_ket, dom_bra, cod_ket, cod_bra = _diagonal(box)
+            sizes = dict(zip(dom_ket + cod_ket, n_dom + n_cod))
+            sizes.update({0: left, 1: mid, 2: right})
+            state = _einsum(
+                state.reshape(left, *n_dom, mid, *bra_dom, right),
+                [0, *dom_ket, 1, *dom_bra, 2],
+                [0, *cod_ket, 1, *cod_bra, 2], sizes, dtype)
+        else:
+            n_wires = len(n_dom + n_cod)
+            dom_ket = list(range(3, 3 + len(n_dom)))
+            cod_ket = list(range(3 + len(n_dom), 3 + n_wires))
+            dom_bra = [i + n_wires for i, q in zip(dom_ket, q_dom) if q]
+            cod_bra = [i + n_wires for i, q in zip(cod_ket, q_cod) if q]
+            state = numpy.einsum(
+                state.reshape(left, *n_dom, mid, *bra_dom, right),
+                [0, *dom_ket, 1, *dom_bra, 2],
+                numpy.asarray(functor(box).array, dtype),
+                _classical_first(dom_ket, q_dom) + dom_bra
+                + _classical_first(cod_ket, q_cod) + cod_bra,
+                [0, *cod_ket, 1, *cod_bra, 2])
+        wires[off:off + len(n_dom)] = n_cod
+        quantum[off:off + len(n_dom)] = q_cod
+    bra = [dim for dim, q in zip(wires, quantum) if q]
+    state = state.reshape(batch, *wires, *bra).transpose(
+        0, *[1 + i for i in _classical_first(range(len(wires)), quantum)],
+        *range(1 + len(wires), 1 + len(wires) + len(bra)))
+    return Channel[dtype](state, dom, cod)
+
+
+class Tableau:
+    """
+    A stabilizer tableau for ``n_qubits`` starting in the all-zero state,
+    following Aaronson and Gottesman, with one column of phases per shot.
+
+    The first ``n_qubits`` rows are the destabilizers, the last ones the
+    stabilizers. Only the phases depend on the outcomes of measurements, so
+    each gate and measurement is applied to all the shots at once.
+
+    Parameters:
+        n_qubits : The number of qubits.
+        n_shots : The number of shots, i.e. of columns of phases.
+
+    Example
+    -------
+    >>> tableau = Tableau(2, n_shots=4)
+    >>> tableau.h(0); tableau.cx(0, 1)
+    >>> outcomes, probability = tableau.measure(0, outcome=[0, 1, 0, 1])
+    >>> assert probability == .5
+    >>> second, probability = tableau.measure(1)
+    >>> assert probability == 1 and all(second == outcomes)
+    """
+    def __init__(self, n_qubits: int, n_shots: int = 1):
+        import numpy
+        self.n_qubits = n_qubits
+        self.x = numpy.zeros((2 * n_qubits, n_qubits), bool)
+        self.z = numpy.zeros((2 * n_qubits, n_qubits), bool)
+        self.r = numpy.zeros((2 * n_qubits, n_shots), bool)
+        self.x[range(n_qubits), range(n_qubits)] = True
+        self.z[range(n_qubits, 2 * n_qubits), range(n_qubits)] = True
+
+    def h(self, a: int):
+        """ Apply a Hadamard gate to qubit ``a``. """
+        self.r ^= (self.x[:, a] & self.z[:, a])[:, None]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a: int):
+        """ Apply a phase gate to qubit ``a``. """
+        self.r ^= (self.x[:, a] & self.z[:, a])[:, None]
+        self.z[:, a] ^= self.x[:, a]
+
+    def pauli(self, a: int, name: str):
+        """ Apply a Pauli gate ``"X"``, ``"Y"`` or ``"Z"`` to qubit ``a``. """
+        flip = {"X": self.z[:, a], "Y": self.x[:, a] ^ self.z[:, a],
+                "Z": self.x[:, a]}[name]
+        self.r ^= flip[:, None]
+
+    def cx(self, a: int, b: int):
+        """ Apply a controlled X gate from qubit ``a`` to qubit ``b``. """
+        self.r ^= (self.x[:, a] & self.z[:, b]
+                   & ~(self.x[:, b] ^ self.z[:, a]))[:, None]
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+
+    @staticmethod
+    def _phase(x1, z1, x2, z2):
+        """ The power of ``i`` in the product of two Pauli strings. """
+        import numpy
+        x1, z1, x2, z2 = (numpy.asarray(v, int) for v in (x1, z1, x2, z2))
+        return (x1 * z1 * (z2 - x2) + x1 * (1 - z1) * z2 * (2 * x2 - 1)
+                + (1 - x1) * z1 * x2 * (1 - 2 * z2)).sum(axis=-1)
+
+    def is_random(self, a: int) -> bool:
+        """ Whether the outcome of measuring qubit ``a`` is random. """
+        return bool(self.x[self.n_qubits:, a].any())
+
+    def measure(self, a: int, outcome=None, rng=None):
+        """
+        Measure qubit ``a`` in the computational basis.
+
+        Parameters:
+            a : The qubit to measure.
+            outcome : The outcome for each shot if the measurement is random,
+                default is to sample it.
+            rng : The :code:`numpy.random.Generator` to sample outcomes.
+
+        Returns:
+            outcomes : The outcome for each shot.
+            probability : Either ``.5`` if the outcome is random, else ``1``.
+        """
+        import numpy
+        n, x, z, r = self.n_qubits, self.x, self.z, self.r
+        stabilizers = numpy.flatnonzero(x[n:, a])
+        if not stabilizers.size:
+            rows = n + numpy.flatnonzero(x[:n, a])
+            xs, zs = x[rows], z[rows]
+            before_x = numpy.bitwise_xor.accumulate(xs, axis=0) ^ xs
+            before_z = numpy.bitwise_xor.accumulate(zs, axis=0) ^ zs
+            phase = self._phase(xs, zs, before_x, before_z).sum() % 4
+            return numpy.bitwise_xor.reduce(r[rows], axis=0) ^ (phase == 2), 1
+        p = n + stabilizers[0]
+        rows = numpy.flatnonzero(x[:, a])
+        rows = rows[rows != p]
+        phase = self._phase(x[p], z[p], x[rows], z[rows]) % 4
+        r[rows] ^= r[p] ^ (phase == 2)[:, None]
+        x[rows] ^= x[p]
+        z[rows] ^= z[p]
+        x[p - n], z[p - n], r[p - n] = x[p], z[p], r[p]
+        x[p], z[p] = False, False
+        z[p, a] = True
+        if outcome is None:
+            rng = rng or numpy.random.default_rng()
+            outcome = rng.integers(0, 2, r.shape[1])
+        r[p] = outcome
+        return r[p].copy(), .5
+
+
+def _clifford_gate(box) -> list[tuple] | None:
+    """
+    The tableau operations for a Clifford gate on qubits ``0, 1, ...``,
+    or ``None`` if the box is not a Clifford gate.
+    """
+    if box in (H, S, S.dagger(), X, Y, Z):
+        return [("h", 0)] if box == H else [("s", 0)] if box == S\
+            else 3 * [("s", 0)] if box == S.dagger() else [
+                ("pauli", 0, box.name)]
+    if isinstance(box, (Rx, Ry, Rz)):
+        try:
+            turns = 4 * float(box.phase)
+        except TypeError:
+            return None
+        if turns != int(turns):
+            return None
+        phase = int(turns) % 4 * [("s", 0)]
+        return phase if isinstance(box, Rz)\
+            else [("h", 0)] + phase + [("h", 0)] if isinstance(box, Rx)\
+            else 3 * [("s", 0)] + [("h", 0)] + phase + [("h", 0), ("s", 0)]
+    if isinstance(box, Controlled) and box.controlled in (X, Y, Z):
+        control, target = (0, box.distance) if box.distance > 0\
+            else (-box.distance, 0)
+        before, after = {
+            X: ([], []), Y: (3 * [("s", target)], [("s", target)]),
+            Z: ([("h", target)], [("h", target)])}[box.controlled]
+        return before + [("cx", control, target)] + after
+    return None
+
+
+def is_clifford(circuit: Circuit) -> bool:
+    """
+    Whether a circuit is made of kets, bras, measurements, discards, scalars,
+    swaps and Clifford gates, i.e. whether :func:`stabilizer`,
+    :func:`stabilizer_probability` and :func:`stabilizer_counts` can simulate
+    it from no inputs to bits.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, H, T, CX, Measure, qubit
+    >>> assert is_clifford(Ket(0, 0) >> H @ qubit >> CX >> Measure(2))
+    >>> assert not is_clifford(Ket(0) >> T >> Measure())
+    """
+    return not isinstance(circuit, Sum) and all(
+        isinstance(box, (Swap, Ket, Bra, Discard, Scalar))
+        or isinstance(box, Measure) and not box.override_bits
+        or _clifford_gate(box) is not None for box in circuit.boxes)
+
+
+def _stabilizer_program(circuit: Circuit) -> tuple[int, list, list]:
+    """
+    Compile a Clifford circuit from no inputs into the number of qubits of its
+    tableau, a list of operations and the bits in its codomain.
+    """
+    if circuit.dom or not is_clifford(circuit) or any(
+            isinstance(obj, Qudit) for obj in circuit.cod.inside):
+        raise ValueError(messages.NOT_CLIFFORD.format(circuit))
+    n_qubits, program, wires, measures = 0, [], [], dict()
+    for box, off in zip(circuit.boxes, circuit.offsets):
+        inputs = wires[off:off + len(box.dom)]
+        qubits = [i for kind, i in inputs if kind == "qubit"]
+        if isinstance(box, Swap):
+            outputs = inputs[::-1]
+        elif isinstance(box, Ket):
+            outputs = [("qubit", n_qubits + i) for i in range(len(box.cod))]
+            program += [("pauli", n_qubits + i, "X")
+                        for i, value in enumerate(box.bitstring) if value]
+            n_qubits += len(box.cod)
+        elif isinstance(box, Bra):
+            outputs = []
+            program += [("postselect", i, value)
+                        for i, value in zip(qubits, box.bitstring)]
+        elif isinstance(box, Measure):
+            outputs = [("bit", len(measures) + i) for i in range(len(qubits))]
+            for i, (_, bit) in zip(qubits, outputs):
+                measures[bit] = (len(program), box.destructive)
+                program.append(("measure", i, bit))
+            if not box.destructive:
+                outputs = [("qubit", i) for i in qubits] + outputs
+        elif isinstance(box, Discard):
+            outputs = []
+            for kind, i in inputs:
+                if kind == "bit" and measures[i][1]:
+                    program[measures[i][0]] = None  # Measure then discard.
+        elif isinstance(box, Scalar):
+            outputs = []
+            program.append(("scalar", box.array if box.is_mixed
+                            else abs(box.array) ** 2))
+        else:
+            outputs = inputs
+            program += [tuple(
+                qubits[x] if isinstance(x, int) else x for x in op)
+                for op in _clifford_gate(box)]
+        wires[off:off + len(box.dom)] = outputs
+    return n_qubits, [op for op in program if op is not None], [
+        i for _, i in wires]
+
+
+def stabilizer_probability(circuit: Circuit, bitstring=()) -> float:
+    """
+    The probability of an outcome of a Clifford circuit, computed in
+    polynomial time with a :class:`Tableau`.
+
+    For a pure circuit from kets to bras, this is the squared absolute value
+    of its amplitude, the tableau forgets the global phase. Random
+    measurements whose bits are marginalised, i.e. beyond the length of the
+    bitstring or discarded without destroying their qubit, branch the
+    tableau, so that the cost is exponential in their number.
+
+    Parameters:
+        circuit : A Clifford circuit with no inputs and bits as outputs.
+        bitstring : The outcome for each of the bits in ``circuit.cod``,
+            any bits beyond its length are marginalised.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, Bra, H, CX, Measure, qubit
+    >>> ghz = Ket(*100 * [0]) >> H @ qubit ** 99
+    >>> for i in range(99):
+    ...     ghz = ghz >> qubit ** i @ CX @ qubit ** (98 - i)
+    >>> stabilizer_probability(ghz >> Measure(100), 100 * (1, ))
+    0.5
+    >>> stabilizer_probability(ghz >> Bra(*50 * [1] + 50 * [0]))
+    0.0
+    """
+    import numpy
+    n_qubits, program, cod = _stabilizer_program(circuit)
+    outcomes = dict(zip(cod, bitstring))
+    tableau, weights = Tableau(n_qubits), numpy.ones(1)
+    for name, *args in program:
+        if name == "scalar":
+            weights = weights * args[0]
+        elif name == "measure" and args[1] not in outcomes:
+            if tableau.is_random(args[0]):  # Branch on both outcomes.
+                tableau.r = numpy.repeat(tableau.r, 2, axis=1)
+                weights = numpy.repeat(weights, 2) / 2
+                tableau.measure(
+                    args[0], outcome=numpy.arange(len(weights)) % 2)
+        elif name in ("measure", "postselect"):
+            value = outcomes[args[1]] if name == "measure" else args[1]
+            result, probability = tableau.measure(
+                args[0], outcome=numpy.full(len(weights), value, bool))
+            weights = weights * probability * (result == value)
+        else:
+            getattr(tableau, name)(*args)
+    return float(numpy.real(weights.sum()))
+
+
+def stabilizer_counts(
+        circuit: Circuit, n_shots: int = 2 ** 10, seed: int = None) -> dict:
+    """
+    Sample the outcomes of a Clifford circuit, all the shots at once with a
+    :class:`Tableau` with one column of phases per shot.
+
+    Bras are sampled as measurements and the shots where they fail are
+    rejected, so that the counts add up to the number of shots that passed
+    the post-selection. Scalars are ignored.
+
+    Parameters:
+        circuit : A Clifford circuit with no inputs and bits as outputs.
+        n_shots : The number of shots.
+        seed : The seed for the random number generator.
+
+    Returns:
+        counts : From bitstrings to counts.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, H, CX, Measure, qubit
+    >>> bell = Ket(0, 0) >> H @ qubit >> CX >> Measure(2)
+    >>> counts = stabilizer_counts(bell, n_shots=1000, seed=42)
+    >>> sorted(counts), sum(counts.values())
+    ([(0, 0), (1, 1)], 1000)
+    """
+    import numpy
+    n_qubits, program, cod = _stabilizer_program(circuit)
+    rng = numpy.random.default_rng(seed)
+    tableau, bits = Tableau(n_qubits, n_shots), dict()
+    accepted = numpy.ones(n_shots, bool)
+    for name, *args in program:
+        if name == "measure":
+            bits[args[1]], _ = tableau.measure(args[0], rng=rng)
+        elif name == "postselect":
+            result, _ = tableau.measure(args[0], rng=rng)
+            accepted &= result == args[1]
+        elif name != "scalar":
+            getattr(tableau, name)(*args)
+    if not cod:
+        return {(): int(accepted.sum())} if accepted.any() else {}
+    samples = numpy.stack([bits[i] for i in cod], axis=1)[accepted]
+    outcomes, counts = numpy.unique(
+        samples.astype(int), axis=0, return_counts=True)
+    return dict(zip(map(tuple, outcomes.tolist()), counts.tolist()))
+
+
+def stabilizer(circuit: Circuit) -> Channel:
+    """
+    Simulate a Clifford circuit from no inputs to bits with a
+    :class:`Tableau`, i.e. compute the probability of each of its outcomes
+    in one run with one column of phases per branch.
+
+    Random measurements branch the tableau on both outcomes, so that the cost
+    is polynomial in the number of qubits and gates but exponential in the
+    number of random measurements. Branches rejected by a bra are dropped.
+    This is used by :meth:`Circuit.eval` with ``simulator="stabilizer"``
+    only, never by default.
+
+    Note
+    ----
+    The result is dense, with ``2 ** len(circuit.cod)`` entries. For many
+    bits, use :func:`stabilizer_probability` or :func:`stabilizer_counts`.
+
+    Parameters:
+        circuit : A Clifford circuit with no inputs and bits as outputs.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, H, CX, Measure, qubit
+    >>> circuit = Ket(0, 0) >> H @ qubit >> CX >> Measure(2)
+    >>> stabilizer(circuit).round(2)  # doctest: +ELLIPSIS
+    Channel([0.5+0.j, 0. +0.j, 0. +0.j, 0.5+0.j], dom=CQ(), cod=...)
+    >>> assert stabilizer(circuit).is_close(density_matrix(circuit))
+    """
+    import numpy
+    dtype = get_precision().accumulation_dtype(complex)
+    functor = Functor({}, {}, dom=Category(Ty, Circuit), dtype=dtype)
+    n_qubits, program, cod = _stabilizer_program(circuit)
+    tableau, weights, bits = Tableau(n_qubits), numpy.ones(1, dtype), dict()
+    for name, *args in program:
+        if name == "scalar":
+            weights = weights * args[0]
+        elif name == "measure" and tableau.is_random(args[0]):
+            tableau.r = numpy.repeat(tableau.r, 2, axis=1)
+            weights = numpy.repeat(weights, 2) / 2
+            bits = {i: numpy.repeat(value, 2) for i, value in bits.items()}
+            bits[args[1]], _ = tableau.measure(
+                args[0], outcome=numpy.arange(len(weights)) % 2)
+        elif name == "measure":
+            bits[args[1]], _ = tableau.measure(args[0])
+        elif name == "postselect":
+            result, probability = tableau.measure(
+                args[0], outcome=numpy.full(len(weights), args[1], bool))
+            keep = result == args[1]
+            tableau.r, weights = tableau.r[:, keep], weights[keep]
+            weights = weights * probability
+            bits = {i: value[keep] for i, value in bits.items()}
+        else:
+            getattr(tableau, name)(*args)
+    array = numpy.zeros(len(cod) * (2, ), dtype) if cod else weights.sum()
+    if cod:
+        numpy.add.at(array, tuple(bits[i].astype(int) for i in cod), weights)
+    return Channel[dtype](array, functor(circuit.dom), functor(circuit.cod))
+
+
+SIMULATORS = {
+    "statevector": statevector,
+    "density_matrix": density_matrix,
+    "stabilizer": stabilizer,
+}
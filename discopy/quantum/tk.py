@@ -12,6 +12,7 @@ Summary
     :toctree:
 
     Circuit
+    LocalBackend
 
 .. admonition:: Functions
 
@@ -24,12 +25,14 @@ Summary
         from_tk
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytket as tk
 from pytket.circuit import Bit, Op, OpType, Qubit
 from pytket.utils import probs_from_counts
 
+from discopy import messages
 from discopy.quantum.circuit import Functor, Id, bit, qubit, Circuit as Diagram
 from discopy.quantum.gates import (
     ClassicalGate, Controlled, QuantumGate, Bits, Bra, Digits, Ket,
@@ -395,6 +398,124 @@ def from_tk(tk_circuit):
     return circuit >> tk_circuit.post_processing
 
 
+class LocalBackend:
+    """
+    A local backend which samples shots from the exact probabilities of each
+    circuit, see :meth:`probabilities`. They are computed with
+    :func:`discopy.quantum.simulator.statevector` when every measurement
+    comes after the last gate on its qubit, and with the density matrix of
+    :meth:`discopy.quantum.circuit.Circuit.measure` otherwise.
+
+    It implements the :code:`process_circuits` and :code:`get_result` methods
+    of :class:`pytket.backends.Backend` used by :meth:`Circuit.get_counts`,
+    which takes care of normalisation, post-selection and scaling.
+
+    Parameters:
+        seed : The default seed for the random number generator.
+
+    Example
+    -------
+    >>> from discopy.quantum import Ket, H, CX, Measure, qubit
+    >>> circuit = Ket(0, 0) >> H @ qubit >> CX >> Measure(2)
+    >>> backend = LocalBackend(seed=42)
+    >>> counts = circuit.get_counts(backend=backend, n_shots=1000)
+    >>> sorted(counts)
+    [(0, 0), (1, 1)]
+    >>> assert all(abs(p - .5) < .05 for p in counts.values())
+    >>> assert counts == circuit.get_counts(
+    ...     backend=LocalBackend(seed=42), n_shots=1000)
+    """
+    def __init__(self, seed: int = None):
+        self.seed, self.results, self.n_handles = seed, dict(), 0
+
+    def process_circuits(self, circuits, n_shots=2 ** 10, seed=None):
+        """
+        Sample :code:`n_shots` outcomes for each circuit.
+
+        Parameters:
+            circuits : The :class:`pytket.Circuit` to sample from.
+            n_shots : The number of shots for each circuit.
+            seed : The seed for this batch, default is :code:`self.seed`.
+
+        Returns:
+            handles : The handles to pass to :meth:`get_result`.
+        """
+        import numpy
+        rng = numpy.random.default_rng(self.seed if seed is None else seed)
+        handles = []
+        for circuit in circuits:
+            probs = numpy.clip(self.probabilities(circuit), 0, None)
+            samples = rng.multinomial(
+                n_shots, probs.ravel() / probs.sum()).reshape(probs.shape)
+            counts = dict(zip(
+                map(tuple, numpy.argwhere(samples).tolist()),
+                samples.reshape(-1)[numpy.flatnonzero(samples)].tolist()))
+            handles.append(self.n_handles)
+            self.results[self.n_handles] = SimpleNamespace(
+                get_counts=lambda counts=counts: counts)
+            self.n_handles += 1
+        return handles
+
+    @staticmethod
+    def probabilities(circuit):
+        """
+        The probability of each outcome of the bits in a circuit.
+
+        If every measurement comes after the last gate on its qubit we
+        simulate the statevector of the gates then take the marginals,
+        otherwise we simulate the density matrix of the whole circuit.
+
+        Parameters:
+            circuit : The :class:`pytket.Circuit` to simulate.
+
+        Raises:
+            NotImplementedError : If any other command acts on bits, e.g. a
+                conditional gate or a classical operation.
+        """
+        import numpy
+        from discopy.quantum.simulator import statevector
+        gates, measured = tk.Circuit(circuit.n_qubits), dict()
+        for command in circuit.get_commands():
+            qubits = [x.index[0] for x in command.qubits]
+            if command.op.type == OpType.Measure:
+                bit_index = command.bits[0].index[0]
+                if bit_index in measured or qubits[0] in measured.values():
+                    break
+                measured[bit_index] = qubits[0]
+            elif len(command.args) > len(qubits):
+                raise NotImplementedError(
+                    messages.CLASSICAL_COMMAND.format(command))
+            elif set(qubits) & set(measured.values()):
+                break
+            else:
+                gates.add_gate(command.op, qubits)
+        else:
+            pure = from_tk(gates)
+            n_discards = 0  # Keep the qubits open.
+            while n_discards < len(pure) and isinstance(
+                    pure.boxes[len(pure) - 1 - n_discards], Discard):
+                n_discards += 1
+            probs = numpy.absolute(statevector(
+                pure[:len(pure) - n_discards]).array) ** 2
+            qubits = sorted(measured.values())
+            probs = probs.sum(axis=tuple(
+                i for i in range(circuit.n_qubits) if i not in qubits))
+            probs = probs.transpose(
+                [qubits.index(measured[i]) for i in sorted(measured)])
+            for i in range(circuit.n_bits):
+                if i not in measured:  # Unmeasured bits are always zero.
+                    probs = numpy.stack([probs, 0 * probs], axis=i)
+            return probs
+        return from_tk(Circuit.upgrade(circuit)).measure(mixed=True)
+
+    def get_result(self, handle):
+        """
+        The result of a circuit, with a :code:`get_counts` method, which is
+        forgotten by the backend once returned.
+        """
+        return self.results.pop(handle)
+
+
 def mockBackend(*counts):
     """ Takes a list of counts, returns a mock backend that outputs them. """
     def get_result(i):
@@ -74,6 +74,8 @@ class Diagram(pivotal.Diagram, balanced.Diagram):
         dom (pivotal.Ty) : The domain of the diagram, i.e. its input.
         cod (pivotal.Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     def trace(self, n=1, left=False):
         """
         The trace of a ribbon diagram.
@@ -138,6 +140,8 @@ class Box(pivotal.Box, balanced.Box, Diagram):
         dom (pivotal.Ty) : The domain of the box, i.e. its input.
         cod (pivotal.Ty) : The codomain of the box, i.e. its output.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (pivotal.Box, balanced.Box, )
 
 
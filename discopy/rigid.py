@@ -64,6 +64,8 @@ class Ob(cat.Ob):
     >>> a = Ob('a')
     >>> assert a.l.r == a.r.l == a and a != a.l.l != a.r.r
     """
+    __slots__ = ("z", )
+
     __ambiguous_inheritance__ = True
 
     def __init__(self, name: str, z: int = 0):
@@ -85,7 +87,7 @@ class Ob(cat.Ob):
         return cat.Ob.__eq__(self, other) and self.z == other.z
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.name, self.z))
 
     def __repr__(self):
         return factory_name(type(self))\
@@ -121,6 +123,8 @@ class Ty(closed.Ty):
     >>> assert n.l.r == n == n.r.l
     >>> assert (s @ n).l == n.l @ s.l and (s @ n).r == n.r @ s.r
     """
+    __slots__ = ()
+
     def assert_isadjoint(self, other):
         """
         Raise ``AxiomError`` if two rigid types are not adjoints.
@@ -168,6 +172,8 @@ class PRO(monoidal.PRO, Ty):
     n : int
         The length of the PRO type.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (monoidal.PRO, )
     l = r = property(lambda self: self)
 
@@ -183,6 +189,8 @@ class Layer(monoidal.Layer):
         more : More boxes and types to the right,
                used by :meth:`Diagram.foliation`.
     """
+    __slots__ = ()
+
     def rotate(self, left=False):
         return type(self)(*(x.l if left else x.r for x in list(self)[::-1]))
 
@@ -212,6 +220,8 @@ class Diagram(closed.Diagram):
     .. image:: /_static/rigid/diagram-example.png
         :align: center
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = True
 
     ty_factory = Ty
@@ -409,7 +419,7 @@ class Diagram(closed.Diagram):
             left_obstruction, right_obstruction = [], []
             while i < len(diagram) - 1:
                 i += 1
-                box, off = diagram.boxes[i], diagram.offsets[i]
+                box, off = diagram.encoding[i]
                 if off <= j < off + len(box.dom):
                     return i, j, (left_obstruction, right_obstruction)
                 if off <= j:
@@ -424,18 +434,19 @@ class Diagram(closed.Diagram):
             Given a diagram, returns (cup, cap, obstructions, left_snake)
             if there is a yankable pair, otherwise returns None.
             """
+            boxes, offsets = diagram.boxes, diagram.offsets
             for cap in range(len(diagram)):
-                if not isinstance(diagram.boxes[cap], Cap):
+                if not isinstance(boxes[cap], Cap):
                     continue
-                for left_snake, wire in [(True, diagram.offsets[cap]),
-                                         (False, diagram.offsets[cap] + 1)]:
+                for left_snake, wire in [(True, offsets[cap]),
+                                         (False, offsets[cap] + 1)]:
                     cup, wire, obstructions =\
                         follow_wire(diagram, cap, wire)
                     not_yankable =\
                         cup == len(diagram)\
-                        or not isinstance(diagram.boxes[cup], Cup)\
-                        or left_snake and diagram.offsets[cup] + 1 != wire\
-                        or not left_snake and diagram.offsets[cup] != wire
+                        or not isinstance(boxes[cup], Cup)\
+                        or left_snake and offsets[cup] + 1 != wire\
+                        or not left_snake and offsets[cup] != wire
                     if not_yankable:
                         continue
                     return cup, cap, obstructions, left_snake
@@ -539,6 +550,8 @@ class Box(closed.Box, Diagram):
     >>> assert f.r.l == f == f.l.r
     >>> assert f.l.l != f != f.r.r
     """
+    __slots__ = ("z", )
+
     __ambiguous_inheritance__ = (closed.Box, )
 
     def __init__(self, name: str, dom: Ty, cod: Ty, data=None, z=0, **params):
@@ -560,8 +573,7 @@ class Box(closed.Box, Diagram):
             return cat.Box.__eq__(self, other) and self.z == other.z
         return monoidal.Box.__eq__(self, other)
 
-    def __hash__(self):
-        return hash(repr(self))
+    __hash__ = monoidal.Box.__hash__
 
     def rotate(self, left=False):
         dom, cod = (
@@ -14,6 +14,10 @@ Summary
     Dim
     Tensor
     Functor
+    Plan
+    PathCache
+    MemoryMap
+    MappedArray
     Diagram
     Box
     Swap
@@ -22,18 +26,39 @@ Summary
     Spider
     Sum
     Bubble
+
+.. admonition:: Functions
+
+    .. autosummary::
+        :template: function.rst
+        :nosignatures:
+        :toctree:
+
+        einsum_path
+        einsum_slices
+        einsum_cost
+        intermediates
+        contract
 """
 
 from __future__ import annotations
 
+import builtins
+import json
+import os
+from collections.abc import Iterator, Mapping
+from functools import partial, reduce
+from operator import add
+
 from discopy import (
-    cat, monoidal, rigid, symmetric, frobenius)
+    cat, config, matrix, messages, monoidal, rigid, symmetric, frobenius)
 from discopy.cat import factory, assert_iscomposable
 from discopy.frobenius import Ty, Cup, Category
-from discopy.matrix import Matrix, backend
+from discopy.matrix import Matrix, backend, get_precision
 from discopy.monoidal import assert_isatomic
 from discopy.rigid import assert_isadjoint
-from discopy.utils import factory_name, assert_isinstance, product
+from discopy.utils import (
+    factory_name, assert_isinstance, product, LRUCache)
 
 
 @factory
@@ -47,6 +72,8 @@ class Dim(Ty):
     >>> Dim(1) @ Dim(2) @ Dim(3)
     Dim(2, 3)
     """
+    __slots__ = ()
+
     ob_factory = int
 
     def __init__(self, *inside: int):
@@ -130,8 +157,13 @@ class Tensor(Matrix):
     def __init__(self, array, dom: Dim, cod: Dim):
         assert_isinstance(dom, Dim)
         assert_isinstance(cod, Dim)
-        super().__init__(array, product(dom.inside), product(cod.inside))
-        self.array = self.array.reshape(dom.inside + cod.inside)
+        if isinstance(array, MappedArray):  # A view of the file, not a copy.
+            with backend() as np:
+                self.array = np.asarray(array, dtype=self.dtype).reshape(
+                    dom.inside + cod.inside)
+        else:
+            super().__init__(array, product(dom.inside), product(cod.inside))
+            self.array = self.array.reshape(dom.inside + cod.inside)
         self.dom, self.cod = dom, cod
 
     @classmethod
@@ -207,10 +239,19 @@ class Tensor(Matrix):
         assert_isatomic(typ, Dim)
         n, = typ.inside
         dom, cod = typ ** n_legs_in, typ ** n_legs_out
-        result = cls.zero(dom, cod)
-        for i in range(n):
-            result.array[len(dom @ cod) * (i, )] = 1
-        return result
+        n_legs = len(dom @ cod)
+        if not n_legs:  # A scalar spider is a loop, i.e. the trace of id.
+            return cls(n, dom, cod)
+        if n_legs == 1:
+            with backend() as np:
+                return cls(np.ones(n), dom, cod)
+        from string import ascii_letters
+        subscripts = ",".join(
+            ascii_letters[i:i + 2] for i in range(n_legs - 1))
+        with backend() as np:
+            array = np.einsum(subscripts + "->" + ascii_letters[:n_legs],
+                              *(n_legs - 1) * [cls.id(typ).array])
+        return cls(array, dom, cod)
 
     @classmethod
     def spiders(cls, n_legs_in: int, n_legs_out: int, typ: Dim, phase=None
@@ -362,34 +403,414 @@ class Functor(frobenius.Functor):
         if isinstance(other, (cat.Ob, cat.Box)):
             return super().__call__(other)
         assert_isinstance(other, monoidal.Diagram)
-        dim = lambda scan: len(self(scan))
-        scan, array = other.dom, Tensor.id(self(other.dom)).array
-        for box, off in zip(other.boxes, other.offsets):
+        return self.compile(other)()
+
+    def compile(self, diagram: monoidal.Diagram) -> Plan:
+        """
+        Compile the evaluation of a diagram into a reusable :class:`Plan`,
+        i.e. precompute the contraction and permutation steps once and for all.
+
+        Swaps are compiled to permutations and cups, caps and spiders to the
+        identification of indices, so that their dense arrays are never built
+        as part of a diagram. Permutations are tracked rather than applied,
+        i.e. the axes of the running array are moved only once at the end.
+
+        Note
+        ----
+        This only applies to the evaluation of diagrams, which calls this
+        method. The plan still starts from the dense identity on the domain of
+        the diagram, and :meth:`Tensor.id`, :meth:`Tensor.swap`,
+        :meth:`Tensor.spider_factory` as well as the image of a single swap,
+        cup, cap or spider box are dense tensors.
+
+        Parameters:
+            diagram : The diagram to compile.
+
+        Example
+        -------
+        >>> x = rigid.Ty('x')
+        >>> f, g = rigid.Box('f', x, x), rigid.Box('g', x, x)
+        >>> F = Functor({x: 2}, {f: [0, 1, 1, 0], g: [1, 0, 0, -1]},
+        ...             dom=rigid.Category())
+        >>> plan = F.compile(f >> g)
+        >>> assert plan() == F(f >> g)
+        >>> plan([1, 2, 3, 4], [0, 1, 1, 0])
+        Tensor([2, 1, 4, 3], dom=Dim(2), cod=Dim(2))
+        """
+        dim = lambda scan: len(self._memoized_call(scan))
+        policy = get_precision()
+        storage = policy.storage_dtype(self.dtype)
+        factory = self.cod.ar.factory[policy.accumulation_dtype(self.dtype)]
+        cast = lambda key: self._memoized_call(key[0]).cast_dtype(key[1])
+        structural = (rigid.Cup, rigid.Cap, frobenius.Spider)
+        shape_of = Functor(self.ob, {}, self.dom, self.dtype)
+        shape_of.cod = Category(Dim, Diagram)
+        scan, boxes, images, steps = diagram.dom, [], [], []
+        perm = list(range(2 * dim(diagram.dom)))  # logical to physical axes
+        for box, off in zip(diagram.boxes, diagram.offsets):
+            left, n_dom = dim(diagram.dom @ scan[:off]), dim(box.dom)
+            legs = perm[left:left + n_dom]
             if isinstance(box, symmetric.Swap):
-                source = range(
-                    dim(other.dom @ scan[:off]),
-                    dim(other.dom @ scan[:off] @ box.dom))
-                target = [
-                    i + dim(box.right)
-                    if i < dim(other.dom @ scan[:off]) + dim(box.left)
-                    else i - dim(box.left) for i in source]
-                with backend() as np:
-                    array = np.moveaxis(array, list(source), list(target))
-                scan = scan[:off] @ box.cod @ scan[off + len(box.dom):]
-                continue
-            left = dim(scan[:off])
-            source = list(range(dim(other.dom) + left,
-                                dim(other.dom) + left + dim(box.dom)))
-            target = list(range(dim(box.dom)))
-            with backend() as np:
-                array = np.tensordot(array, self(box).array, (source, target))
-            source = range(len(array.shape) - dim(box.cod), len(array.shape))
-            target = range(dim(other.dom) + left,
-                           dim(other.dom) + left + dim(box.cod))
-            with backend() as np:
-                array = np.moveaxis(array, list(source), list(target))
+                n_left = dim(box.left)
+                perm[left:left + n_dom] = legs[n_left:] + legs[:n_left]
+            elif isinstance(box, structural) and (box.dom or box.cod):
+                shape = shape_of(box)
+                _, inputs, output = shape.to_einsum(storage)
+                rest = [len(output) + i for i in range(len(perm) - n_dom)]
+                labels = rest[:left] + list(output[:n_dom]) + rest[left:]
+                inputs = [tuple(labels[perm.index(i)]
+                                for i in range(len(perm)))] + inputs
+                output = tuple(rest[:left]) + output[n_dom:]\
+                    + tuple(rest[left:])
+                steps.append((None, (shape, storage, inputs, output), [], []))
+                perm = list(range(len(output)))
+            else:
+                image = self._memoized_call(box) if storage == self.dtype\
+                    else cast((box, storage)) if self.cache is None\
+                    else self.cache.lookup((box, storage), cast)
+                axes = (legs, list(range(n_dom)))
+                shift = lambda i: i - sum(j < i for j in legs)
+                n_rest, n_cod = len(perm) - n_dom, dim(box.cod)
+                perm = list(map(shift, perm[:left])) + list(range(
+                    n_rest, n_rest + n_cod)) + list(map(
+                        shift, perm[left + n_dom:]))
+                steps.append((len(boxes), axes, [], []))
+                boxes.append(box)
+                images.append(image)
             scan = scan[:off] @ box.cod @ scan[off + len(box.dom):]
-        return self.cod.ar(array, self(other.dom), self(other.cod))
+        if perm != sorted(perm):
+            steps.append((None, None, perm, list(range(len(perm)))))
+        return Plan(self(diagram.dom), self(diagram.cod),
+                    boxes, images, steps, factory=factory)
+
+    def batch_call(self, diagrams: list[monoidal.Diagram],
+                   strategy: str = "greedy", path_cache: PathCache = None
+                   ) -> list[Tensor]:
+        """
+        Evaluate a list of diagrams by grouping them by shape, i.e. the same
+        dimensions in the same places and the same images for their swaps,
+        cups, caps and spiders, then evaluating each group with one call to
+        :meth:`Diagram.batch_eval`.
+
+        The images of boxes and types are computed once per call, or once and
+        for all if the functor is memoized, see :meth:`cat.Functor.memoize`.
+
+        Parameters:
+            diagrams : The diagrams to evaluate, e.g. pregroup sentences.
+            strategy : The contraction order, see :func:`einsum_path`.
+            path_cache : The :class:`PathCache`,
+                :meth:`Diagram.default_path_cache` by default.
+
+        Example
+        -------
+        >>> from discopy.grammar.pregroup import Ty, Word, Cup
+        >>> n, s = Ty('n'), Ty('s')
+        >>> Alice, Bob = Word('Alice', n), Word('Bob', n)
+        >>> loves, hates = Word('loves', n.r @ s @ n.l), Word('hates', n.r @ s)
+        >>> sentences = [
+        ...     Alice @ loves @ Bob >> Cup(n, n.r) @ s @ Cup(n.l, n),
+        ...     Alice @ hates >> Cup(n, n.r) @ s,
+        ...     Bob @ loves @ Alice >> Cup(n, n.r) @ s @ Cup(n.l, n)]
+        >>> F = Functor(
+        ...     ob={n: 2, s: 1}, dom=rigid.Category(),
+        ...     ar={Alice: [1, 0], Bob: [0, 1],
+        ...         loves: [0, 1, 1, 0], hates: [1, 0]})
+        >>> assert F.batch_call(sentences) == list(map(F, sentences))
+        """
+        structural = (symmetric.Swap, rigid.Cup, rigid.Cap, frobenius.Spider)
+        cache = LRUCache() if self.cache is None else self.cache
+        image_of, buckets = (lambda x: cache.lookup(x, self)), {}
+        shape_of = Functor(self.ob, {}, self.dom, self.dtype)
+        shape_of.cod, shapes = Category(Dim, Diagram), LRUCache()
+        for i, diagram in enumerate(diagrams):
+            key, arrays = [image_of(diagram.dom)], []
+            for layer in diagram.inside:
+                layer_key = []
+                for k, box_or_typ in enumerate(layer):
+                    if not k % 2:
+                        layer_key.append(image_of(box_or_typ))
+                    elif isinstance(box_or_typ, structural):
+                        layer_key.append(shapes.lookup(box_or_typ, shape_of))
+                    else:
+                        image = image_of(box_or_typ)
+                        layer_key.append((image.dom, image.cod))
+                        arrays.append(image.array)
+                key.append(tuple(layer_key))
+            indices, stacks = buckets.setdefault(
+                tuple(key), ([], [[] for _ in arrays]))
+            indices.append(i)
+            for stack, array in zip(stacks, arrays):
+                stack.append(array)
+        result = len(diagrams) * [None]
+        for (dom, *layers), (indices, stacks) in buckets.items():
+            shape, batch = Diagram.id(dom), {}
+            for layer_key in layers:
+                layer = Diagram.id()
+                for k, item in enumerate(layer_key):
+                    if not k % 2:
+                        layer @= Diagram.id(item)
+                    elif isinstance(item, Diagram):
+                        layer @= item
+                    else:
+                        box = Box(str(len(batch)), *item)
+                        with backend() as np:
+                            batch[box] = np.stack(stacks[len(batch)])
+                        layer @= box
+                shape >>= layer
+            arrays = shape.batch_eval(batch, self.dtype, strategy, path_cache)
+            if not batch:  # Only structural boxes, i.e. a batch of one.
+                with backend() as np:
+                    arrays = np.broadcast_to(
+                        arrays, (len(indices), ) + tuple(arrays.shape[1:]))
+            for i, array in zip(indices, arrays):
+                result[i] = self.cod.ar(array, shape.dom, shape.cod)
+        return result
+
+
+class Plan:
+    """
+    A plan is a precomputed list of contraction and permutation steps for the
+    evaluation of a fixed diagram, see :meth:`Functor.compile`.
+
+    Parameters:
+        dom : The domain of the result.
+        cod : The codomain of the result.
+        boxes : The boxes of the diagram, excluding swaps.
+        images : The image of each box, used by default.
+        steps : A list of ``(index, axes, source, target)`` with ``index`` the
+            position of a box in ``boxes`` or ``None`` otherwise, ``axes`` the
+            arguments of ``tensordot``, or ``(shape, dtype, inputs, output)``
+            for cups, caps and spiders, and ``(source, target)`` the arguments
+            of ``moveaxis``, usually empty except for the last step.
+        factory : The tensor class of the result.
+
+    Note
+    ----
+    A plan can be called with one new array for each of its boxes, e.g. with
+    ``plan(*(G(box).array for box in plan.boxes))`` for another functor ``G``
+    with the same object mapping.
+
+    The operands of cups, caps and spiders are built from their ``shape`` at
+    call time, so that a plan can be called under another :func:`backend`
+    than the one it was compiled with.
+    """
+    def __init__(self, dom: Dim, cod: Dim, boxes: list[cat.Box],
+                 images: list[Tensor], steps: list[tuple], factory=Tensor):
+        self.dom, self.cod, self.boxes = dom, cod, boxes
+        self.images, self.steps, self.factory = images, steps, factory
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        return factory_name(type(self)) + f"(dom={self.dom}, cod={self.cod}, "\
+            f"boxes={self.boxes}, steps={self.steps})"
+
+    def __call__(self, *arrays) -> Tensor:
+        if not arrays:
+            arrays = [image.array for image in self.images]
+        elif len(arrays) != len(self.boxes):
+            raise ValueError(messages.WRONG_NUMBER_OF_ARRAYS.format(
+                len(self.boxes), len(arrays)))
+        else:
+            arrays = [type(image)(array, image.dom, image.cod).array
+                      for array, image in zip(arrays, self.images)]
+        array = self.factory.id(self.dom).array
+        with backend() as np:
+            for i, axes, source, target in self.steps:
+                if i is not None:
+                    array = np.tensordot(array, arrays[i], axes)
+                elif axes is not None:
+                    shape, dtype, inputs, output = axes
+                    operands, _, _ = shape.to_einsum(dtype)
+                    array = contract([array] + operands, inputs, output)
+                array = np.moveaxis(array, source, target)
+        return self.factory(array, self.dom, self.cod)
+
+
+class PathCache(LRUCache):
+    """
+    A bounded cache of contraction paths, see :func:`einsum_path`, keyed by
+    the shape signature of a diagram, i.e. the dimensions of the boxes and
+    their wiring as given by :meth:`Diagram.to_einsum`, ignoring box names.
+
+    Parameters:
+        maxsize : The maximum number of paths, unbounded if ``None``.
+        filename : An optional JSON file to load paths from and save them to.
+
+    Example
+    -------
+    >>> x = Dim(2)
+    >>> f, g = Box('f', x, x, [1, 2, 3, 4]), Box('g', x, x, [0, 1, 1, 0])
+    >>> cache = PathCache(maxsize=8)
+    >>> for diagram in [f >> g >> f, g >> f >> g, f @ g]:
+    ...     _ = diagram.eval("einsum", path_cache=cache)
+    >>> cache.hits, cache.misses
+    (1, 2)
+    """
+    def __init__(self, maxsize: int | None = 1024, filename: str = None):
+        super().__init__(maxsize)
+        self.filename = filename
+        if filename is not None and os.path.exists(filename):
+            self.load(filename)
+
+    def __call__(self, inputs: list[tuple[int, ...]], output: tuple[int, ...],
+                 sizes: dict[int, int], strategy: str = "greedy"
+                 ) -> list[tuple[int, int]]:
+        key = (tuple(map(tuple, inputs)), tuple(output),
+               tuple(sorted(sizes.items())), strategy)
+        return self.lookup(
+            key, lambda _: einsum_path(inputs, output, sizes, strategy))
+
+    def save(self, filename: str = None):
+        """
+        Save the cached paths to a JSON file.
+
+        Parameters:
+            filename : The file to write, ``self.filename`` by default.
+        """
+        with open(filename or self.filename, "w") as file:
+            json.dump([[key, path] for key, path in self.items()], file)
+
+    def load(self, filename: str = None):
+        """
+        Load paths from a JSON file.
+
+        Parameters:
+            filename : The file to read, ``self.filename`` by default.
+        """
+        with open(filename or self.filename) as file:
+            for (inputs, output, sizes, strategy), path in json.load(file):
+                key = (tuple(map(tuple, inputs)), tuple(output),
+                       tuple(map(tuple, sizes)), strategy)
+                self[key] = list(map(tuple, path))
+                if self.maxsize is not None and len(self) > self.maxsize:
+                    self.popitem(last=False)
+
+
+class MemoryMap(Mapping):
+    """
+    A read-only mapping from keys to arrays stored one after the other in a
+    memory-mapped file, i.e. they are loaded lazily and paged by the OS.
+
+    Parameters:
+        filename : Either a ``.npy`` file or a raw binary file.
+        index : A mapping from each key to its ``(start, stop)`` entries in
+            the file, read from the ``.json`` file next to it by default.
+        dtype : The datatype of a raw file, ``float`` by default.
+        offset : The number of bytes before the entries of a raw file.
+
+    Example
+    -------
+    >>> import tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "words.npy")
+    >>> words = MemoryMap.save(filename, {
+    ...     "Alice": [1., 0.], "Bob": [0., 1.], "loves": [0., 1., 1., 0.]})
+    >>> words = MemoryMap(filename)
+    >>> Alice = Box("Alice", Dim(1), Dim(2), words["Alice"])
+    >>> loves = Box("loves", Dim(2), Dim(2), words["loves"])
+    >>> (Alice >> loves).eval(dtype=float)
+    Tensor[float]([0., 1.], dom=Dim(1), cod=Dim(2))
+
+    Note
+    ----
+    With the NumPy backend, the arrays of boxes with mapped data and the
+    tensors built from a :class:`MappedArray` with the same ``dtype`` are
+    views of the file, other arrays are copied as usual.
+    """
+    def __init__(self, filename: str, index: Mapping[str, tuple[int, int]]
+                 = None, dtype: type = float, offset: int = 0):
+        if index is None:
+            with open(os.path.splitext(filename)[0] + ".json") as file:
+                index = json.load(file)
+        self.filename, self.dtype, self.offset = filename, dtype, offset
+        self.index = {key: tuple(value) for key, value in index.items()}
+        self._array = None
+
+    @property
+    def array(self):
+        """ The memory map of the whole file, opened on first access. """
+        if self._array is None:
+            import numpy
+            self._array = numpy.load(self.filename, mmap_mode='r').reshape(-1)\
+                if self.filename.endswith(".npy") else numpy.memmap(
+                    self.filename, self.dtype, 'r', self.offset)
+        return self._array
+
+    def __getitem__(self, key) -> MappedArray:
+        if key not in self.index:
+            raise KeyError(key)
+        return MappedArray(self, key)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return factory_name(type(self)) + f"({repr(self.filename)})"
+
+    def __getstate__(self):
+        return dict(self.__dict__, _array=None)
+
+    @classmethod
+    def save(cls, filename: str, arrays: Mapping[str, array],
+             dtype: type = float) -> MemoryMap:
+        """
+        Write arrays one after the other in a ``.npy`` file, without holding
+        them all in memory, and their index in a ``.json`` file next to it.
+
+        Parameters:
+            filename : The ``.npy`` file to write.
+            arrays : The arrays to write, with string keys.
+            dtype : The datatype of the file.
+        """
+        import numpy
+        from numpy.lib.format import open_memmap
+        index, stop = {}, 0
+        for key, array in arrays.items():
+            index[key] = (stop, stop + int(numpy.size(array)))
+            stop = index[key][1]
+        result = open_memmap(filename, 'w+', dtype, (stop, ))
+        for key, array in arrays.items():
+            start, stop = index[key]
+            result[start:stop] = numpy.asarray(array, dtype).reshape(-1)
+        result.flush()
+        del result
+        with open(os.path.splitext(filename)[0] + ".json", "w") as file:
+            json.dump(index, file)
+        return cls(filename, index)
+
+
+class MappedArray:
+    """
+    The slice of a :class:`MemoryMap` for a given key, to be used as the data
+    of a :class:`Box`. It is compared by key and converted lazily to an array.
+
+    Parameters:
+        source : The memory map.
+        key : The key of the array.
+    """
+    def __init__(self, source: MemoryMap, key: str):
+        self.source, self.key = source, key
+
+    def __array__(self, dtype=None, copy=None):
+        start, stop = self.source.index[self.key]
+        array = self.source.array[start:stop]
+        array = array if dtype is None else array.astype(dtype, copy=False)
+        return array.copy() if copy else array
+
+    def __eq__(self, other):
+        return isinstance(other, MappedArray)\
+            and (self.source.filename, self.key)\
+            == (other.source.filename, other.key)
+
+    def __hash__(self):
+        return hash((self.source.filename, self.key))
+
+    def __repr__(self):
+        return f"{repr(self.source)}[{repr(self.key)}]"
 
 
 @factory
@@ -404,15 +825,54 @@ class Diagram(frobenius.Diagram):
     >>> print(diagram)
     vector[::-1] >> vector >> Dim(2) @ vector
     """
+    __slots__ = ()
+
     ty_factory = Dim
 
-    def eval(self, contractor: Callable = None, dtype: type = None) -> Tensor:
+    path_cache = None
+
+    @staticmethod
+    def default_path_cache() -> PathCache:
+        """
+        The :class:`PathCache` shared by all tensor diagrams, created on first
+        use with ``config.PATH_CACHE_SIZE`` as size, i.e. changes to the
+        config have no effect once it exists. Set ``Diagram.path_cache`` to
+        replace it.
+
+        Example
+        -------
+        >>> assert Diagram.default_path_cache() is Diagram.path_cache
+        """
+        if Diagram.path_cache is None:
+            Diagram.path_cache = PathCache(config.PATH_CACHE_SIZE)
+        return Diagram.path_cache
+
+    def eval(self, contractor: Callable | str = None, dtype: type = None,
+             strategy: str = "greedy", path_cache: PathCache = None,
+             memory_limit: int = None, pool: "multiprocessing.Pool" = None,
+             precision: str = None) -> Tensor:
         """
         Evaluate a tensor diagram as a :class:`Tensor`.
 
         Parameters:
-            contractor : Use ``tensornetwork`` or :class:`Functor` by default.
+            contractor : Use ``tensornetwork``, ``"einsum"`` to contract
+                :meth:`to_einsum` or :class:`Functor` by default.
             dtype : Used for spiders.
+            strategy : The contraction order for ``"einsum"``, see
+                :func:`einsum_path`.
+            path_cache : The :class:`PathCache` for ``"einsum"``, with
+                :meth:`Diagram.default_path_cache` as default.
+            memory_limit : The maximum number of entries of intermediates for
+                ``"einsum"``, met by slicing, see :func:`einsum_slices`.
+            pool : An optional process pool to contract the slices.
+            precision : The name of a dtype policy, see
+                :class:`discopy.matrix.Precision`, e.g. ``"single"`` or
+                ``"mixed"``, the one of the current context by default.
+
+        Note
+        ----
+        With ``"einsum"``, the mixed policy contracts in the storage dtype and
+        only the result is cast to the accumulation dtype.
 
         Examples
         --------
@@ -420,14 +880,250 @@ class Diagram(frobenius.Diagram):
         >>> assert (vector >> vector[::-1]).eval().array == 1
         >>> from tensornetwork.contractors import auto
         >>> assert (vector >> vector[::-1]).eval(auto).array == 1
+        >>> assert (vector >> vector[::-1]).eval("einsum").array == 1
+        >>> assert (vector >> vector[::-1]).eval(
+        ...     "einsum", memory_limit=1).array == 1
+        >>> (vector >> vector[::-1]).eval(dtype=float, precision="single")
+        Tensor[float32]([1.], dom=Dim(1), cod=Dim(1))
         """
+        if precision is not None:
+            with matrix.precision(precision):
+                return self.eval(contractor, dtype, strategy, path_cache,
+                                 memory_limit, pool)
         dtype = dtype or Tensor.dtype
         if contractor is None:
             return Functor(
-                ob=lambda x: x, ar=lambda f: f.array, dtype=dtype)(self)
+                ob=lambda x: x, ar=lambda f: f.array, dtype=dtype
+            ).compile(self)()
+        if contractor == "einsum":
+            policy = get_precision()
+            operands, inputs, output = self.to_einsum(
+                dtype=policy.storage_dtype(dtype))
+            sizes = {i: n for op, idx in zip(operands, inputs)
+                     for i, n in zip(idx, op.shape)}
+            path_cache = self.default_path_cache() if path_cache is None\
+                else path_cache
+            path = path_cache(inputs, output, sizes, strategy)
+            slices = () if memory_limit is None else einsum_slices(
+                inputs, output, sizes, path, memory_limit)
+            array = contract(operands, inputs, output, path, slices, pool)
+            return Tensor[policy.accumulation_dtype(dtype)](
+                array, self.dom, self.cod)
         array = contractor(*self.to_tn(dtype=dtype)).tensor
         return Tensor[dtype](array, self.dom, self.cod)
 
+    def batch_eval(self, batch: Mapping[Box, array], dtype: type = None,
+                   strategy: str = "greedy", path_cache: PathCache = None
+                   ) -> array:
+        """
+        Evaluate a tensor diagram on a batch of arrays for some of its boxes,
+        i.e. stacks of arrays with a shared leading batch axis, as one einsum
+        contraction where the batch axis is kept in the output.
+
+        Parameters:
+            batch : A stack of arrays for each box with a batch axis, their
+                daggers get the conjugate transpose and the other boxes are
+                shared across the batch.
+            dtype : The datatype of the result.
+            strategy : The contraction order, see :func:`einsum_path`.
+            path_cache : The :class:`PathCache`,
+                :meth:`Diagram.default_path_cache` by default.
+
+        Returns:
+            The array of shape ``(batch_size, *dom, *cod)``.
+
+        Example
+        -------
+        >>> vector = Box('vector', Dim(1), Dim(2))
+        >>> matrix = Box('matrix', Dim(2), Dim(2), [0, 1, 1, 0])
+        >>> (vector >> matrix).batch_eval({vector: [[1, 0], [0, 1], [1, 2]]})
+        array([[0, 1],
+               [1, 0],
+               [2, 1]])
+        """
+        dtype = dtype or Tensor.dtype
+        path_cache = self.default_path_cache() if path_cache is None\
+            else path_cache
+        batched = []
+
+        def stack(box):
+            if box.is_dagger and box not in batch:
+                source = range(1, len(box.dom @ box.cod) + 1)
+                target = [i + len(box.dom) if i <= len(box.cod)
+                          else i - len(box.cod) for i in source]
+                with backend() as np:
+                    return np.conjugate(np.moveaxis(
+                        stack(box.dagger()), list(source), target))
+            with backend() as np:
+                return np.reshape(np.array(batch[box], dtype=dtype),
+                                  (-1, ) + box.dom.inside + box.cod.inside)
+
+        def ar(box):
+            batched.append(
+                box in batch or box.is_dagger and box.dagger() in batch)
+            return stack(box) if batched[-1] else Functor(
+                ob=lambda x: x, ar=lambda f: f.array, dtype=dtype)(box).array
+        operands, inputs, output = self.to_einsum(dtype=dtype, ar=ar)
+        batched += (len(operands) - len(batched)) * [False]
+        sizes = {
+            i: n for op, idx, is_batched in zip(operands, inputs, batched)
+            for i, n in zip(idx, op.shape[1:] if is_batched else op.shape)}
+        axis, batch_size = len(sizes), max([1] + [
+            op.shape[0] for op, is_batched in zip(operands, batched)
+            if is_batched])
+        if not any(batched):
+            with backend() as np:
+                operands.append(np.ones(batch_size, dtype=dtype))
+            inputs.append(())
+            batched.append(True)
+        sizes[axis] = batch_size
+        inputs = [(axis, ) + idx if is_batched else idx
+                  for idx, is_batched in zip(inputs, batched)]
+        output = (axis, ) + output
+        path = path_cache(inputs, output, sizes, strategy)
+        return contract(operands, inputs, output, path)
+
+    def estimate_cost(self, strategy: str = "functor") -> dict[str, int]:
+        """
+        Estimate the cost of evaluating a tensor diagram from its shape only,
+        i.e. without computing any array.
+
+        Parameters:
+            strategy : Either ``"functor"`` for the box-by-box contraction of
+                :class:`Functor` or a strategy of :func:`einsum_path` for the
+                contraction of :meth:`to_einsum`. As in
+                :meth:`Functor.compile`, swaps are free and cups, caps and
+                spiders cost the identification of their indices.
+
+        Returns:
+            The number of ``flops``, the size of the largest intermediate
+            ``peak`` and the largest ``rank`` of any tensor.
+
+        Example
+        -------
+        >>> x = Dim(10)
+        >>> f, g = Box('f', Dim(1), x @ x), Box('g', x @ x, Dim(1))
+        >>> diagram = f @ f >> x @ g @ x >> g
+        >>> diagram.estimate_cost()
+        {'flops': 20200, 'peak': 10000, 'rank': 4}
+        >>> diagram.estimate_cost("greedy")
+        {'flops': 2100, 'peak': 100, 'rank': 2}
+        """
+        if strategy != "functor":
+            import numpy
+            operands, inputs, output = self.to_einsum(
+                ar=lambda box: numpy.broadcast_to(
+                    numpy.empty(()), box.dom.inside + box.cod.inside))
+            sizes = {i: n for op, idx in zip(operands, inputs)
+                     for i, n in zip(idx, op.shape)}
+            path = self.default_path_cache()(inputs, output, sizes, strategy)
+            return einsum_cost(inputs, output, sizes, path)
+        size = lambda typ: product(list(typ.inside))
+        scan, flops, peak = self.dom, 0, size(self.dom) ** 2
+        rank = 2 * len(self.dom)
+        for box, off in zip(self.boxes, self.offsets):
+            if isinstance(box, (Cup, Cap, Spider)) and box.data is None\
+                    and (box.dom or box.cod):
+                left, n_dom = len(self.dom @ scan[:off]), len(box.dom)
+                operands, inputs, output = box.to_einsum()
+                rest = tuple(len(output) + i for i in range(
+                    len(self.dom @ scan) - n_dom))
+                inputs = [rest[:left] + output[:n_dom] + rest[left:]] + inputs
+                output = rest[:left] + output[n_dom:] + rest[left:]
+                sizes = dict(zip(inputs[0], (self.dom @ scan).inside))
+                sizes.update({i: n for op, idx in zip(operands, inputs[1:])
+                              for i, n in zip(idx, op.shape)})
+                cost = einsum_cost(inputs, output, sizes, einsum_path(
+                    inputs, output, {}, "naive"))
+                flops, peak = flops + cost["flops"], max(peak, cost["peak"])
+                rank = max(rank, cost["rank"])
+            elif not isinstance(box, symmetric.Swap):
+                flops += size(self.dom @ scan) * size(box.cod)
+                rank = max(rank, len(box.dom @ box.cod))
+            scan = scan[:off] @ box.cod @ scan[off + len(box.dom):]
+            peak = max(peak, size(self.dom @ scan))
+            rank = max(rank, len(self.dom @ scan))
+        return dict(flops=flops, peak=peak, rank=rank)
+
+    def to_einsum(self, dtype: type = None, ar: Callable = None) -> tuple[
+            list[array], list[tuple[int, ...]], tuple[int, ...]]:
+        """
+        Convert a tensor diagram to einsum format, i.e. a list of operands,
+        the list of their indices and the indices of the output.
+
+        Swaps permute the indices and cups, caps and spiders without phase
+        merge them, so that only the remaining boxes become operands.
+
+        Parameters:
+            dtype : Used for spiders.
+            ar : The array of each remaining box, in the order of the diagram,
+                given by its evaluation by default.
+
+        Example
+        -------
+        >>> vector = Box('vector', Dim(1), Dim(2), [0, 1])
+        >>> matrix = Box('matrix', Dim(2), Dim(2), [0, 1, 1, 0])
+        >>> operands, inputs, output = (vector >> matrix).to_einsum()
+        >>> inputs, output
+        ([(0,), (0, 1)], (1,))
+        >>> operands, inputs, output = Cup(Dim(2), Dim(2)).to_einsum()
+        >>> inputs, output
+        ([(0, 1)], (0, 1))
+        """
+        dtype = dtype or Tensor.dtype
+        ar = ar or (lambda box: Functor(
+            ob=lambda x: x, ar=lambda f: f.array, dtype=dtype)(box).array)
+        parents, sizes = [], []
+
+        def find(i):
+            while parents[i] != i:
+                parents[i] = i = parents[parents[i]]
+            return i
+
+        def wires(typ):
+            for n in typ.inside:
+                parents.append(len(parents))
+                sizes.append(n)
+            return list(range(len(parents) - len(typ), len(parents)))
+
+        inputs = scan = wires(self.dom)
+        operands, indices = [], []
+        for box, off in zip(self.boxes, self.offsets):
+            legs = scan[off:off + len(box.dom)]
+            if isinstance(box, symmetric.Swap):
+                legs = legs[len(box.left):] + legs[:len(box.left)]
+            elif isinstance(box, (Cup, Cap, Spider)) and box.data is None:
+                legs = legs + wires(box.cod)
+                for leg in legs[1:]:
+                    parents[find(leg)] = find(legs[0])
+                if not legs:
+                    wires(box.typ)  # A scalar spider is a loop.
+                legs = legs[len(box.dom):]
+            else:
+                operands.append(ar(box))
+                indices.append(legs + wires(box.cod))
+                legs = indices[-1][len(box.dom):]
+            scan = scan[:off] + legs + scan[off + len(box.dom):]
+        indices = [list(map(find, idx)) for idx in indices]
+        output, seen = [], set()
+        for i in map(find, inputs + scan):
+            if i in seen:
+                j, = wires(Dim(sizes[i]))
+                operands.append(Tensor[dtype].id(Dim(sizes[i])).array)
+                indices.append([i, j])
+                i = j
+            output.append(i)
+            seen.add(i)
+        covered = {i for idx in indices for i in idx}
+        for i in sorted(set(map(find, range(len(parents)))) - covered):
+            operands.append(
+                Tensor[dtype]([1] * sizes[i], Dim(1), Dim(sizes[i])).array)
+            indices.append([i])
+        renaming = {i: j for j, i in enumerate(dict.fromkeys(
+            [i for idx in indices for i in idx] + output))}
+        inputs = [tuple(renaming[i] for i in idx) for idx in indices]
+        return operands, inputs, tuple(renaming[i] for i in output)
+
     def to_tn(self, dtype: type = None) -> tuple[
             list["tensornetwork.Node"], list["tensornetwork.Edge"]]:
         """
@@ -528,13 +1224,17 @@ class Box(frobenius.Box, Diagram):
         data : The array inside the tensor box.
         dtype : The datatype for the entries of the array.
     """
+    __slots__ = ()
+
     __ambiguous_inheritance__ = (frobenius.Box, )
 
     @property
     def array(self):
         if self.data is not None:
             with backend() as np:
-                return np.array(self.data).reshape(
+                convert = np.asarray\
+                    if isinstance(self.data, MappedArray) else np.array
+                return convert(self.data).reshape(
                     self.dom.inside + self.cod.inside)
 
     def grad(self, var, **params):
@@ -692,3 +1392,235 @@ Diagram.sum_factory, Diagram.braid_factory = Sum, Swap
 Diagram.cup_factory, Diagram.cap_factory = Cup, Cap
 Diagram.spider_factory, Diagram.bubble_factory = Spider, Bubble
 Id = Diagram.id
+
+
+def einsum_path(inputs: list[tuple[int, ...]], output: tuple[int, ...],
+                sizes: dict[int, int], strategy: str = "greedy"
+                ) -> list[tuple[int, int]]:
+    """
+    Find a contraction path, i.e. a list of pairs of positions in the list of
+    operands, where each pair is contracted and its result put at the end.
+
+    Parameters:
+        inputs : The indices of each operand.
+        output : The indices of the output.
+        sizes : The dimension of each index.
+        strategy : Either ``"naive"`` for left-to-right contraction or
+            ``"greedy"`` for the cheapest contraction first, i.e. the one
+            that removes the most entries, with the smallest one as tie-break.
+
+    Example
+    -------
+    >>> inputs, output = [(0, 1), (1, 2), (2, )], (0, )
+    >>> sizes = {0: 10, 1: 10, 2: 10}
+    >>> einsum_path(inputs, output, sizes, "naive")
+    [(0, 1), (0, 1)]
+    >>> einsum_path(inputs, output, sizes)
+    [(1, 2), (0, 1)]
+    """
+    alive = [frozenset(idx) for idx in inputs]
+    if strategy == "naive":
+        return [(0, 1)] * (len(alive) > 1)\
+            + [(0, n - 1) for n in range(len(alive) - 1, 1, -1)]
+    if strategy != "greedy":
+        raise ValueError(messages.UNKNOWN_STRATEGY.format(strategy))
+    counts = dict.fromkeys(output, 1)
+    for idx in alive:
+        for i in idx:
+            counts[i] = counts.get(i, 0) + 1
+    size = lambda idx: product([sizes[i] for i in idx])
+    path = []
+    while len(alive) > 1:
+        candidates = [
+            (a, b) for a in range(len(alive)) for b in range(a + 1, len(alive))
+            if alive[a] & alive[b]] or [tuple(sorted(
+                range(len(alive)), key=lambda k: size(alive[k]))[:2])]
+        best = None
+        for a, b in candidates:
+            union = alive[a] | alive[b]
+            result = frozenset(
+                i for i in union
+                if counts[i] > (i in alive[a]) + (i in alive[b]))
+            cost = (size(result) - size(alive[a]) - size(alive[b]),
+                    size(union))
+            if best is None or cost < best[0]:
+                best = cost, (a, b), result
+        _, (a, b), result = best
+        for i in alive[a] | alive[b]:
+            counts[i] -= (i in alive[a]) + (i in alive[b]) - (i in result)
+        alive = [idx for k, idx in enumerate(alive) if k not in (a, b)]
+        alive.append(result)
+        path.append((a, b))
+    return path
+
+
+def einsum_slices(inputs: list[tuple[int, ...]], output: tuple[int, ...],
+                  sizes: dict[int, int], path: list[tuple[int, int]],
+                  memory_limit: int) -> list[int]:
+    """
+    Choose indices to slice, i.e. to fix to each of their values in turn, so
+    that every intermediate of a contraction has at most ``memory_limit``
+    entries. Each time, we slice the index which minimises the largest
+    intermediate.
+
+    Parameters:
+        inputs : The indices of each operand.
+        output : The indices of the output, which are never sliced.
+        sizes : The dimension of each index.
+        path : The contraction path, see :func:`einsum_path`.
+        memory_limit : The maximum number of entries of any intermediate.
+
+    Raises:
+        ValueError : If the limit cannot be met, e.g. it is below the size of
+            the output.
+
+    Example
+    -------
+    >>> inputs, output = [(0, 1), (1, 2), (2, 0)], ()
+    >>> sizes, path = {0: 10, 1: 10, 2: 2}, [(0, 1), (0, 1)]
+    >>> einsum_slices(inputs, output, sizes, path, memory_limit=10)
+    [0]
+    """
+    def peak(sliced):
+        return max([1] + [
+            product([sizes[i] for i in result if i not in sliced])
+            for _, result in intermediates(inputs, output, path)])
+    sliced = []
+    while peak(sliced) > memory_limit:
+        candidates = [i for i in dict.fromkeys(sum(map(tuple, inputs), ()))
+                      if i not in output and i not in sliced and sizes[i] > 1]
+        best = min(candidates, default=None,
+                   key=lambda i: (peak(sliced + [i]), sizes[i]))
+        if best is None or peak(sliced + [best]) == peak(sliced):
+            raise ValueError(messages.MEMORY_LIMIT.format(memory_limit))
+        sliced.append(best)
+    return sliced
+
+
+def intermediates(inputs: list[tuple[int, ...]], output: tuple[int, ...],
+                  path: list[tuple[int, int]]
+                  ) -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+    """
+    The indices involved in each step of a contraction path and those of
+    its result.
+
+    Parameters:
+        inputs : The indices of each operand.
+        output : The indices of the output.
+        path : The contraction path, see :func:`einsum_path`.
+
+    Example
+    -------
+    >>> list(intermediates([(0, 1), (1, 2), (2, )], (0, ), [(1, 2), (0, 1)]))
+    [((1, 2), (1,)), ((0, 1), (0,))]
+    """
+    inputs = list(map(tuple, inputs))
+    for a, b in path:
+        rest = set(output).union(*(
+            idx for k, idx in enumerate(inputs) if k not in (a, b)))
+        union = tuple(dict.fromkeys(inputs[a] + inputs[b]))
+        result = tuple(i for i in union if i in rest)
+        yield union, result
+        inputs = [idx for k, idx in enumerate(inputs) if k not in (a, b)]
+        inputs.append(result)
+
+
+def einsum_cost(inputs: list[tuple[int, ...]], output: tuple[int, ...],
+                sizes: dict[int, int], path: list[tuple[int, int]]
+                ) -> dict[str, int]:
+    """
+    The number of ``flops``, the size of the largest intermediate ``peak``
+    and the largest ``rank`` of any tensor in a contraction.
+
+    Parameters:
+        inputs : The indices of each operand.
+        output : The indices of the output.
+        sizes : The dimension of each index.
+        path : The contraction path, see :func:`einsum_path`.
+
+    Example
+    -------
+    >>> inputs, output = [(0, 1), (1, 2), (2, )], (0, )
+    >>> sizes = {0: 10, 1: 10, 2: 10}
+    >>> einsum_cost(inputs, output, sizes, [(0, 1), (0, 1)])
+    {'flops': 1100, 'peak': 100, 'rank': 2}
+    >>> einsum_cost(inputs, output, sizes, [(1, 2), (0, 1)])
+    {'flops': 200, 'peak': 10, 'rank': 2}
+    """
+    size = lambda idx: product([sizes[i] for i in idx])
+    flops, peak = 0, size(output) if not path else 1
+    rank = max(map(len, list(inputs) + [output]))
+    for union, result in intermediates(inputs, output, path):
+        flops, peak = flops + size(union), max(peak, size(result))
+        rank = max(rank, len(result))
+    return dict(flops=flops, peak=peak, rank=rank)
+
+
+def contract(operands: list[array], inputs: list[tuple[int, ...]],
+             output: tuple[int, ...], path: list[tuple[int, int]] = None,
+             slices: list[int] = (), pool: "multiprocessing.Pool" = None
+             ) -> array:
+    """
+    Contract a list of operands following a path, one pair at a time with
+    the ``einsum`` of the current :func:`backend`.
+
+    Parameters:
+        operands : The arrays to contract.
+        inputs : The indices of each operand.
+        output : The indices of the output.
+        path : The contraction path, see :func:`einsum_path`.
+        slices : Indices to slice, see :func:`einsum_slices`, i.e. we sum the
+            contractions for each of their values.
+        pool : An optional process pool, or anything with a ``map`` method,
+            to contract the slices in parallel.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> x, y = np.array([[1, 2], [3, 4]]), np.array([1, 1])
+    >>> contract([x, y], [(0, 1), (1, )], (0, ), [(0, 1)])
+    array([3, 7])
+    >>> contract([x, y], [(0, 1), (1, )], (0, ), [(0, 1)], slices=[1])
+    array([3, 7])
+    """
+    from string import ascii_letters
+    operands, inputs = list(operands), list(map(tuple, inputs))
+    path = einsum_path(inputs, output, {}, "naive") if path is None else path
+    if slices:
+        (index, *slices), size = slices, dict(zip(
+            sum(inputs, ()), sum((op.shape for op in operands), ())))
+        task = partial(
+            contract_slice, operands, inputs, output, path, index, slices)
+        return reduce(add, (pool or builtins).map(task, range(size[index])))
+
+    def einsum(args, result):
+        letters = {i: ascii_letters[n] for n, i in enumerate(
+            dict.fromkeys(sum(args, ()) + result))}
+        subscripts = ",".join(''.join(letters[i] for i in idx)
+                              for idx in args)
+        return subscripts + "->" + ''.join(letters[i] for i in result)
+
+    with backend() as np:
+        for (a, b), (_, result) in zip(
+                path, intermediates(inputs, output, path)):
+            array = np.einsum(einsum((inputs[a], inputs[b]), result),
+                              operands[a], operands[b])
+            operands = [x for k, x in enumerate(operands) if k not in (a, b)]
+            inputs = [idx for k, idx in enumerate(inputs) if k not in (a, b)]
+            operands.append(array)
+            inputs.append(result)
+        if not operands:
+            return np.ones(())
+        array, = operands
+        idx, = inputs
+        return array if idx == output else np.einsum(
+            einsum((idx, ), output), array)
+
+
+def contract_slice(operands, inputs, output, path, index, slices, value):
+    """ Contract the slice of a network where ``index`` takes ``value``. """
+    operands = [
+        array[tuple(value if i == index else slice(None) for i in idx)]
+        for array, idx in zip(operands, inputs)]
+    inputs = [tuple(i for i in idx if i != index) for idx in inputs]
+    return contract(operands, inputs, output, path, slices)
@@ -35,6 +35,8 @@ class Diagram(monoidal.Diagram):
         dom (monoidal.Ty) : The domain of the diagram, i.e. its input.
         cod (monoidal.Ty) : The codomain of the diagram, i.e. its output.
     """
+    __slots__ = ()
+
     def trace(self, n=1, left=False):
         """
         Feed ``n`` outputs back into inputs.
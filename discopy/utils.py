@@ -5,8 +5,12 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import MemberDescriptorType
+from weakref import WeakValueDictionary
 
-from discopy import messages
+from discopy import messages, config
 
 from typing import Callable, Generic, Mapping, Iterable, TypeVar, Any,\
     Hashable,\
@@ -244,13 +248,301 @@ def load_corpus(url):
 
 def assert_isinstance(object, cls: type | tuple[type, ...]):
     """ Raise ``TypeError`` if ``object`` is not instance of ``cls``. """
-    classes = cls if isinstance(cls, tuple) else (cls, )
-    cls_name = ' | '.join(map(factory_name, classes))
-    if not any(isinstance(object, cls) for cls in classes):
+    if not isinstance(object, cls):
+        classes = cls if isinstance(cls, tuple) else (cls, )
+        cls_name = ' | '.join(map(factory_name, classes))
         raise TypeError(messages.TYPE_ERROR.format(
             cls_name, factory_name(type(object))))
 
 
+@contextmanager
+def interning(enabled: bool = True):
+    """
+    Context manager for hash-consing, i.e. sharing one canonical instance
+    between all the types, layers and boxes built from the same arguments.
+
+    Parameters:
+        enabled : Whether to turn interning on or off.
+
+    Note
+    ----
+    Canonical instances are kept in weak-value tables, one per factory,
+    so they are garbage collected as soon as nothing else refers to them.
+    Objects built with unhashable arguments, e.g. boxes with arrays as data,
+    are never interned.
+
+    Example
+    -------
+    >>> from discopy.monoidal import Ty
+    >>> x, y = Ty('x'), Ty('y')
+    >>> assert x @ y == x @ y and x @ y is not x @ y
+    >>> with interning():
+    ...     assert x @ y is x @ y and (x @ y)[:1] is (y @ x)[1:]
+    """
+    previous, config.INTERNING = config.INTERNING, enabled
+    try:
+        yield
+    finally:
+        config.INTERNING = previous
+
+
+@contextmanager
+def trusted(enabled: bool = True):
+    """
+    Context manager for trusted construction, i.e. arrows and diagrams are
+    built without checking that their boxes and layers compose.
+
+    Parameters:
+        enabled : Whether to turn trusted mode on or off.
+
+    Note
+    ----
+    This is only meant for input that is known to be well-typed, e.g. some
+    corpus that was serialised from valid diagrams. Ill-typed input will not
+    raise any error but may lead to wrong results later on, use
+    :meth:`cat.Arrow.validate` to run the checks on demand.
+
+    Example
+    -------
+    >>> from discopy.monoidal import Ty, Box, Diagram
+    >>> x, y = Ty('x'), Ty('y')
+    >>> f = Box('f', x, y)
+    >>> with trusted():
+    ...     diagram = Diagram.decode(x, [(f, 0), (f, 0)])
+    >>> diagram.validate()
+    Traceback (most recent call last):
+    ...
+    discopy.cat.AxiomError: f does not compose with f: y != x.
+    """
+    previous, config.TRUSTED = config.TRUSTED, enabled
+    try:
+        yield
+    finally:
+        config.TRUSTED = previous
+
+
+_INTERNED = dict()
+
+
+def interned(cls: type, *args, _tables=_INTERNED, **kwargs):
+    """
+    Call ``cls(*args, **kwargs)`` or return the canonical instance built from
+    the same arguments if :func:`interning` is on.
+
+    Parameters:
+        cls : The factory to call.
+        args : Positional arguments passed to ``cls``.
+        kwargs : Keyword arguments passed to ``cls``.
+
+    Example
+    -------
+    >>> from discopy.cat import Ob
+    >>> with interning():
+    ...     assert interned(Ob, 'x') is interned(Ob, 'x')
+    ...     assert interned(Ob, 'x') is not interned(Ob, 'y')
+    """
+    if not config.INTERNING:
+        return cls(*args, **kwargs)
+    table = _tables.setdefault(cls, WeakValueDictionary())
+    try:
+        key = _intern_key(*args, **kwargs)
+        return table[key]
+    except KeyError:
+        result = table[key] = cls(*args, **kwargs)
+        return result
+    except TypeError:  # Unhashable arguments.
+        return cls(*args, **kwargs)
+
+
+def uninterned(obj, *args, _tables=_INTERNED, **kwargs) -> None:
+    """
+    Remove an object from the table of canonical instances if it is the one
+    built from the given arguments, e.g. before it gets mutated.
+
+    Parameters:
+        obj : The object to remove.
+        args : Positional arguments it was built from.
+        kwargs : Keyword arguments it was built from.
+
+    Example
+    -------
+    >>> from discopy.cat import Ob
+    >>> with interning():
+    ...     x = interned(Ob, 'x')
+    ...     uninterned(x, 'x')
+    ...     assert interned(Ob, 'x') is not x
+    """
+    table = _tables.get(type(obj))
+    if not table:
+        return
+    try:
+        key = _intern_key(*args, **kwargs)
+        if table.get(key) is obj:
+            del table[key]
+    except TypeError:  # Unhashable arguments.
+        return
+
+
+def _intern_key(*args, **kwargs) -> tuple:
+    """ The key of the canonical instance built from some arguments. """
+    key = (args, tuple(map(type, args)))
+    if kwargs:
+        key += tuple(sorted(kwargs.items())), tuple(
+            type(kwargs[k]) for k in sorted(kwargs))
+    return key
+
+
+class cached_slot:
+    """
+    Like :class:`functools.cached_property` but for classes with
+    ``__slots__``, the value is stored in the slot ``name + "_cache"``.
+
+    Parameters:
+        method : The method computing the value to cache.
+
+    Example
+    -------
+    >>> class Square:
+    ...     __slots__ = ("n", "area_cache")
+    ...     def __init__(self, n):
+    ...         self.n = n
+    ...     @cached_slot
+    ...     def area(self):
+    ...         print("Computing...")
+    ...         return self.n ** 2
+    >>> square = Square(3)
+    >>> assert not cached_slot.is_cached(square, "area")
+    >>> square.area
+    Computing...
+    9
+    >>> square.area
+    9
+    """
+    def __init__(self, method: Callable):
+        self.method, self.__doc__ = method, method.__doc__
+        self.slot = method.__name__ + "_cache"
+
+    def __set_name__(self, owner, name):
+        self.slot = name + "_cache"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            result = self.method(obj)
+            setattr(obj, self.slot, result)
+            return result
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+    @staticmethod
+    def is_cached(obj, name: str) -> bool:
+        """ Whether the value of ``obj.name`` has already been computed. """
+        return hasattr(obj, name + "_cache")
+
+
+def getstate(obj) -> tuple[dict | None, dict]:
+    """
+    The state of an object with ``__slots__``, used by :mod:`pickle` and
+    :mod:`copy`. Values cached with :class:`cached_slot` are left out, they
+    may depend on the hash seed of the current process, and so are slots
+    shadowed by a property, e.g. the name of a :class:`monoidal.Ty`.
+
+    Parameters:
+        obj : The object to get the state of.
+
+    Example
+    -------
+    >>> import pickle
+    >>> from discopy.monoidal import Ty
+    >>> x = Ty('x', 'y')
+    >>> _ = hash(x)
+    >>> getstate(x)
+    (None, {'inside': (cat.Ob('x'), cat.Ob('y'))})
+    >>> assert pickle.loads(pickle.dumps(x)) == x
+    """
+    slots = {}
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name.endswith("_cache") or not isinstance(
+                    getattr(type(obj), name, None), MemberDescriptorType):
+                continue
+            try:
+                slots[name] = getattr(obj, name)
+            except AttributeError:
+                continue
+    return getattr(obj, "__dict__", None), slots
+
+
+class LRUCache(OrderedDict):
+    """
+    A dictionary with at most ``maxsize`` items which evicts the least
+    recently used ones and counts cache hits and misses.
+
+    Parameters:
+        maxsize : The maximum number of items, unbounded if ``None``.
+
+    Example
+    -------
+    >>> cache = LRUCache(maxsize=2)
+    >>> for key in "abca":
+    ...     _ = cache.lookup(key, str.upper)
+    >>> cache
+    LRUCache(maxsize=2, hits=0, misses=4, keys=['c', 'a'])
+    >>> cache.lookup('c', str.upper)
+    'C'
+    >>> cache.hits, cache.misses
+    (1, 4)
+    >>> cache.clear()
+    >>> cache
+    LRUCache(maxsize=2, hits=0, misses=0, keys=[])
+    """
+    def __init__(self, maxsize: int | None = None):
+        super().__init__()
+        self.maxsize, self.hits, self.misses = maxsize, 0, 0
+
+    def lookup(self, key: Hashable, compute: Callable) -> Any:
+        """
+        Return the value cached for ``key`` or ``compute(key)`` on a miss.
+
+        Parameters:
+            key : The key to look up.
+            compute : The function to call on a cache miss.
+
+        Note
+        ----
+        Keys which cannot be hashed or compared, e.g. boxes with arrays as
+        data, are computed every time and never cached.
+        """
+        try:
+            result = self[key]
+        except KeyError:
+            pass
+        except (TypeError, ValueError):  # Unhashable or incomparable key.
+            return compute(key)
+        else:
+            self.move_to_end(key)
+            self.hits += 1
+            return result
+        result = self[key] = compute(key)
+        self.misses += 1
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self.popitem(last=False)
+        return result
+
+    def clear(self):
+        """ Remove all the cached values and reset the statistics. """
+        super().clear()
+        self.hits = self.misses = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(maxsize={self.maxsize}, "\
+            f"hits={self.hits}, misses={self.misses}, keys={list(self)})"
+
+
 def mmap(binary_method):
     """ Turn a binary method into n-ary. """
     def method(self, *others):
@@ -31,6 +31,18 @@ def test_Functor():
     assert functor(sqrt(4)) == Channel[float](dom=CQ(), cod=CQ(), array=[4])
 
 
+def test_Functor_dagger():
+    functor = Functor({}, {}, dtype=complex)
+    for gate in [S, T, Rx(0.3), CRz(0.3), H @ S >> CX]:
+        identity = Id(gate.dom).eval(mixed=True)
+        assert (gate >> gate.dagger()).eval(mixed=True).is_close(identity)
+        assert functor(gate.dagger()).is_close(functor(gate).dagger())
+    circuit = Ket(0) >> H >> T >> Rx(0.3).dagger() >> Rx(0.3) >> T.dagger()\
+        >> H >> Measure()
+    assert circuit.eval(mixed=True).is_close(
+        Channel[complex]([1, 0], CQ(), C(Dim(2))))
+
+
 def test_Channel_measure():
     import numpy as np
     array = np.zeros((2, 2, 2, 2, 2))
@@ -207,6 +207,9 @@ def test_bra_ket_inputs():
 
 def test_Circuit_get_counts():
     assert Id(qubit).get_counts() == {(): 1.0}
+    counts = (Ket(0, 0) >> H @ X >> CX >> Measure(2)).get_counts()
+    assert set(counts) == {(0, 1), (1, 0)}
+    assert np.allclose(list(counts.values()), [.5, .5])
 
 
 def test_Circuit_conjugate():
@@ -216,6 +219,11 @@ def test_Circuit_conjugate():
 def test_Circuit_measure():
     assert Id().measure() == 1
     assert all(Bits(0).measure(mixed=True) == np.array([1, 0]))
+    circuit = Ket(0, 1, 0) >> H @ CX >> CRz(0.3) @ H
+    for i in range(8):
+        bits = index2bitstring(i, 3)
+        assert np.isclose(circuit.measure()[bits], abs(
+            (circuit >> Bra(*bits)).eval().array) ** 2)
 
 
 def test_Box():
@@ -502,3 +510,14 @@ def test_CX_decompose(x, y):
     # but CX matrices are self transpose
     assert (out == out.T).all()
     assert (out == unitary_mat).all()
+
+
+def test_gate_slots():
+    for gate in [
+            H, CX, Rx(0.25), Ket(0, 1), Bra(1), Measure(), Discard(),
+            Encode(), Copy(), Scalar(2), Sqrt(2), Controlled(H, distance=2)]:
+        assert not hasattr(gate, "__dict__")
+    assert Rx(0.25).drawing_name == "Rx(0.25)" and Ket(0).draw_as_brakets
+    assert Box('f', qubit, qubit, is_mixed=False).is_classical is False
+    assert Box('f', bit, bit, is_mixed=False).is_classical is True
+    assert Measure().is_classical is False
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 
+import numpy as np
 import pytest
 import tensornetwork as tn
 
 from discopy.quantum import (
-    Circuit, IQPansatz,
-    Bra, Copy, CRz, Encode, Id, Ket, Rx, Rz, Match, Measure,
-    MixedState, Discard, bit, qubit, sqrt, CX, H, SWAP, X, Y, Z)
+    Circuit, IQPansatz, Controlled,
+    Bra, Copy, CRz, Encode, Id, Ket, Rx, Ry, Rz, Match, Measure,
+    MixedState, Discard, bit, qubit, sqrt, CX, CZ, H, S, T, SWAP, X, Y, Z)
 
 mixed_circuits = [
     (Copy() >> Encode(2) >> CX >> Rx(0.3) @ Rz(0.3)
@@ -71,3 +72,121 @@ def test_pytorch_consistent_eval(c):
             pure_result
             @ pure_result.conjugate(diagrammatic=False))
         doubled_result.is_close(mixed_result.to_tensor())
+
+
+@pytest.mark.parametrize('c', pure_circuits + [
+        Ket(1, 0, 1) >> H @ CRz(0.3).l >> sqrt(2) @ SWAP @ qubit
+        >> Bra(1) @ qubit ** 2,
+        (Ket(0) >> H) + (Ket(1) >> X @ sqrt(2)),
+        H >> S >> S.dagger() >> H])
+def test_statevector_eval(c):
+    assert c.eval(simulator="statevector").is_close(c.eval())
+    from discopy.quantum.simulator import statevector
+    assert statevector(c, chunk_size=1).is_close(c.eval())
+
+
+@pytest.mark.parametrize('gate', [S, T, Rx(0.3), CRz(0.3), H @ S >> CX])
+def test_statevector_dagger(gate):
+    from discopy.quantum.simulator import statevector
+    identity = Id(gate.dom).eval()
+    assert statevector(gate >> gate.dagger()).is_close(identity)
+    assert statevector(gate.dagger() >> gate).is_close(identity)
+
+
+def test_statevector_errors():
+    with pytest.raises(ValueError):
+        Measure().eval(simulator="statevector")
+    with pytest.raises(ValueError):
+        H.eval(simulator="statevector", mixed=True)
+    with pytest.raises(ValueError):
+        H.eval(simulator="unknown")
+
+
+@pytest.mark.parametrize('c', pure_circuits + mixed_circuits + [
+        Measure(2, destructive=False) >> Discard() @ qubit @ Copy() @ bit,
+        Encode(2) >> CX >> MixedState() @ qubit @ Discard(),
+        (Ket(0) >> H) + (Ket(1) >> X @ sqrt(2)),
+        Ket(0) >> H >> S >> S.dagger() >> H >> Measure()])
+def test_density_matrix_eval(c):
+    result = c.eval(mixed=True, simulator="density_matrix")
+    assert result.dom == c.eval(mixed=True).dom
+    assert result.cod == c.eval(mixed=True).cod
+    assert result.is_close(c.eval(mixed=True))
+
+
+@pytest.mark.parametrize('gate', [S, T, Rx(0.3), CRz(0.3), H @ S >> CX])
+def test_density_matrix_dagger(gate):
+    from discopy.quantum.simulator import density_matrix
+    identity = density_matrix(Id(gate.dom))
+    assert density_matrix(gate >> gate.dagger()).is_close(identity)
+    assert density_matrix(gate.dagger() >> gate).is_close(identity)
+    n_qubits = len(gate.dom)
+    state = Ket(*n_qubits * (0, )) >> H @ Id(gate.dom[1:])
+    assert density_matrix(
+        state >> gate >> gate.dagger() >> Measure(n_qubits)).is_close(
+            density_matrix(state >> Measure(n_qubits)))
+
+
+clifford_circuits = [
+    Ket(0, 0) >> H @ qubit >> CX >> Measure(2),
+    Ket(1, 0, 1) >> H @ S @ Y >> CZ @ qubit >> qubit @ Controlled(Y, -1)
+    >> Rx(0.25) @ Ry(-0.75) @ Rz(0.5) >> Bra(1) @ Measure(2) @ sqrt(2),
+    Ket(0, 1) >> H @ S.dagger() >> Measure(2, destructive=False)
+    >> CX @ Discard(bit) @ bit >> H @ qubit @ bit >> Measure(2) @ bit,
+    Ket(0, 0, 0) >> H @ CX >> SWAP @ qubit >> Bra(0) @ Measure(2)
+    >> Circuit.swap(bit, bit)]
+
+
+@pytest.mark.parametrize('c', clifford_circuits)
+def test_stabilizer_probability(c):
+    from discopy.quantum.simulator import is_clifford, stabilizer_probability
+    assert is_clifford(c)
+    array = c.eval(mixed=True).array.real
+    for bitstring in zip(*np.unravel_index(range(array.size), array.shape)):
+        assert np.isclose(stabilizer_probability(c, bitstring),
+                          array[bitstring])
+
+
+@pytest.mark.parametrize('c', clifford_circuits)
+def test_stabilizer_counts(c):
+    from discopy.quantum.simulator import stabilizer_counts
+    counts = stabilizer_counts(c, n_shots=2 ** 12, seed=42)
+    assert counts == stabilizer_counts(c, n_shots=2 ** 12, seed=42)
+    array = c.eval(mixed=True).array.real
+    for bitstring, count in counts.items():
+        assert abs(count / sum(counts.values())
+                   - array[bitstring] / array.sum()) < .05
+
+
+@pytest.mark.parametrize('c', clifford_circuits)
+def test_stabilizer_eval(c):
+    expected = c.eval(mixed=True, simulator="density_matrix")
+    result = c.eval(mixed=True, simulator="stabilizer")
+    assert (result.dom, result.cod) == (expected.dom, expected.cod)
+    assert result.is_close(expected) and c.eval().is_close(expected)
+
+
+def test_stabilizer_opt_in(monkeypatch):
+    from discopy.quantum import simulator
+    n_qubits = 300  # Too many qubits for the density matrix.
+    ghz = Ket(*n_qubits * [0]) >> H @ qubit ** (n_qubits - 1)
+    for i in range(n_qubits - 1):
+        ghz = ghz >> qubit ** i @ CX @ qubit ** (n_qubits - 2 - i)
+    circuit = ghz >> Measure(2) @ Discard(n_qubits - 2)
+    assert np.allclose(
+        circuit.eval(simulator="stabilizer").array, [[.5, 0], [0, .5]])
+    monkeypatch.setitem(simulator.SIMULATORS, "stabilizer", None)
+    bell = Ket(0, 0) >> H @ qubit >> CX >> Measure(2)
+    assert np.allclose(bell.eval().array, [[.5, 0], [0, .5]])
+    assert bell.get_counts() == pytest.approx({(0, 0): .5, (1, 1): .5})
+
+
+def test_stabilizer_errors():
+    from discopy.quantum.simulator import is_clifford, stabilizer_counts
+    assert not is_clifford(Ket(0) >> T >> Measure())
+    with pytest.raises(ValueError):
+        stabilizer_counts(Ket(0) >> T >> Measure())
+    with pytest.raises(ValueError):
+        stabilizer_counts(H >> Measure())
+    with pytest.raises(ValueError):
+        stabilizer_counts(Ket(0) >> H)
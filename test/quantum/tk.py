@@ -133,3 +133,53 @@ def test_ClassicalGate_eval():
         (0, 0): 256, (0, 1): 256, (1, 0): 256, (1, 1): 256})
     post = ClassicalGate('post', bit ** 2, bit ** 0, [1, 0, 0, 0])
     assert post.eval(backend=backend) == Tensor[complex]([0.25], Dim(1), Dim(1))
+
+
+def test_LocalBackend():
+    circuit = Ket(0, 0) >> sqrt(2) @ H @ Rx(0.2) >> CX >> Measure() @ Bra(0)
+    other = Ket(0) >> H >> Measure()
+    counts = Circuit.get_counts(
+        circuit, other, backend=tk.LocalBackend(seed=42), n_shots=2 ** 14)
+    assert counts == Circuit.get_counts(
+        circuit, other, backend=tk.LocalBackend(), n_shots=2 ** 14, seed=42)
+    for result, expected in zip(counts, [circuit.get_counts(), {
+            (0, ): .5, (1, ): .5}]):
+        assert result.keys() == expected.keys()
+        assert np.allclose(
+            list(result.values()), list(expected.values()), atol=.05)
+    assert Id(qubit).get_counts(backend=tk.LocalBackend()) == {(): 1}
+    mid_circuit = Ket(0, 0) >> H @ qubit\
+        >> Measure(1, destructive=False) @ qubit\
+        >> qubit @ Circuit.swap(bit, qubit) >> CX @ bit >> Measure(2) @ bit
+    assert np.allclose(
+        tk.LocalBackend.probabilities(mid_circuit.to_tk()).ravel(),
+        [.5, 0, 0, 0, 0, 0, 0, .5])
+
+
+def test_LocalBackend_probabilities():
+    circuit = Ket(0, 0, 0) >> H @ Rx(0.3) @ X >> CX @ qubit\
+        >> Measure() @ Discard() @ Measure()
+    assert np.allclose(
+        tk.LocalBackend.probabilities(circuit.to_tk()),
+        circuit.eval().array.real)
+
+
+def test_LocalBackend_results():
+    backend, circuit = tk.LocalBackend(seed=42), Ket(0) >> H >> Measure()
+    for _ in range(3):
+        circuit.get_counts(backend=backend)
+    assert not backend.results and backend.n_handles == 3
+    handle, = backend.process_circuits([circuit.to_tk()])
+    backend.get_result(handle)
+    with raises(KeyError):
+        backend.get_result(handle)
+
+
+def test_LocalBackend_conditional():
+    conditional = tk.Circuit(2, 2)
+    conditional.H(0)
+    conditional.Measure(0, 0)
+    conditional.X(1, condition_bits=[0], condition_value=1)
+    conditional.Measure(1, 1)
+    with raises(NotImplementedError):
+        tk.LocalBackend.probabilities(conditional)
@@ -3,6 +3,8 @@ import tensornetwork as tn
 from pytest import raises
 
 from discopy.cat import AxiomError
+from discopy.utils import product
+from discopy.matrix import precision
 from discopy.tensor import *
 
 
@@ -22,6 +24,69 @@ def test_backend():
     assert isinstance(Tensor.id().array, np.ndarray)
 
 
+def test_sparse_backend():
+    import sparse
+    x, y = Ty('x'), Ty('y')
+    f, g = frobenius.Box('f', x, x @ y), frobenius.Box('g', y, y)
+    diagram = f @ g >> x @ frobenius.Swap(y, y)\
+        >> frobenius.Spider(1, 2, x) @ y @ g.dagger()
+    F = Functor({x: 2, y: 3}, {f: [0] * 11 + [1], g: [0] * 8 + [1]})
+    expected = F(diagram)
+    with backend('sparse'):
+        assert isinstance(Tensor.id(Dim(2)).array, sparse.COO)
+        result = F(diagram)
+        assert isinstance(result.array, sparse.COO)
+        assert result.array.nnz == np.count_nonzero(expected.array) > 0
+        assert result == Tensor(expected.array, expected.dom, expected.cod)
+        assert repr(result) == repr(expected)
+
+
+def test_MemoryMap(tmp_path):
+    import pickle
+    filename = str(tmp_path / "words.npy")
+    arrays = {"f": [1, 2, 3, 4], "g": [0, 1, 1, 0], "v": [1, 0]}
+    source = MemoryMap.save(filename, arrays)
+    assert MemoryMap(filename).index == source.index and len(source) == 3
+    f, g, v = (
+        Box(key, Dim(2) if key != "v" else Dim(1), Dim(2), source[key])
+        for key in "fgv")
+    assert f == Box("f", Dim(2), Dim(2), MemoryMap(filename)["f"])
+    assert np.shares_memory(f.array, source.array)
+    F = Functor(lambda x: x, lambda box: box.data, dtype=float)
+    assert np.shares_memory(F(f).array, source.array)
+    array = np.array([1., 0.])
+    vector = Tensor[float](array, Dim(1), Dim(2))
+    array[0] = 2.
+    assert vector.array[0] == 1.
+    assert F(v >> f >> g) == Tensor[float]([2, 1], Dim(1), Dim(2))
+    assert pickle.loads(pickle.dumps(source))._array is None
+    raw = MemoryMap(filename, source.index, offset=128)
+    assert (raw["g"].__array__() == np.array(arrays["g"])).all()
+    with raises(KeyError):
+        source["h"]
+
+
+def test_precision():
+    import numpy
+    x = Dim(2)
+    f, g = Box('f', x, x, [1, 2, 3, 4]), Box('g', x, x @ x, list(range(8)))
+    diagram = f >> g >> Swap(x, x) >> Spider(2, 1, x)
+    expected = diagram.eval(dtype=float)
+    single = diagram.eval(dtype=float, precision="single")
+    assert single.dtype == numpy.float32
+    with precision("mixed"):
+        mixed = diagram.eval(dtype=float)
+        assert mixed.dtype == float and mixed.is_close(expected)
+        F = Functor(lambda x: x, lambda f: f.array, dtype=float).memoize()
+        plan = F.compile(diagram)
+        assert all(image.dtype == numpy.float32 for image in plan.images)
+        assert plan().dtype == float
+    assert F.compile(diagram).images[0].dtype == float
+    for result in [single, diagram.eval("einsum", dtype=float,
+                                        precision="single")]:
+        assert Tensor[float](result.array, x, x).is_close(expected)
+
+
 def test_Tensor_repr_with_tf():
     with backend('tensorflow'):
         alice = Tensor([1, 2], Dim(1), Dim(2))
@@ -174,6 +239,51 @@ def test_Functor_swap():
            F(frobenius.Swap(x, y) >> g @ f)
 
 
+def test_Functor_compile():
+    x, y = Ty('x'), Ty('y')
+    f, g = frobenius.Box('f', x, x @ y), frobenius.Box('g', y, y)
+    diagram = f @ g >> x @ frobenius.Swap(y, y)\
+        >> frobenius.Spider(1, 0, x) @ y @ g
+    F = Functor({x: 2, y: 3}, {f: list(range(12)), g: list(range(9))})
+    plan = F.compile(diagram)
+    assert plan() == F(diagram) and len(plan.boxes) == 3
+    G = Functor({x: 2, y: 3}, {f: list(range(12)), g: list(range(9, 0, -1))})
+    assert plan(*(G(box).array for box in plan.boxes)) == G(diagram)
+    with raises(ValueError):
+        plan(list(range(12)))
+    swaps = frobenius.Swap(x, y) @ x >> y @ frobenius.Swap(x, x)\
+        >> frobenius.Swap(y, x) @ x
+    assert len(F.compile(swaps)) == 1
+    assert F.compile(swaps)() == frobenius.Functor.__call__(F, swaps)
+
+
+def test_Functor_structural():
+    x, y = Ty('x'), Ty('y')
+    f, g = frobenius.Box('f', x, x @ x @ y), frobenius.Box('g', y @ x, x)
+    diagram = f >> frobenius.Spider(2, 3, x) @ y\
+        >> x @ x @ frobenius.Swap(x, y) >> x @ frobenius.Spider(1, 0, x)\
+        @ g >> frobenius.Spider(2, 2, x) >> x @ frobenius.Spider(1, 0, x)
+    F = Functor({x: 3, y: 2}, {f: list(range(54)), g: list(range(18))})
+    plan = F.compile(diagram)
+    assert plan.boxes == [f, g]
+    assert plan() == frobenius.Functor.__call__(F, diagram)
+    assert F(frobenius.Spider(0, 0, x)) == Tensor(3, Dim(1), Dim(1))
+
+
+def test_Plan_backend():
+    import torch
+    x, y = Ty('x'), Ty('y')
+    f, g = frobenius.Box('f', x, y @ x), frobenius.Box('g', y @ x, x)
+    diagram = f >> y @ frobenius.Spider(1, 2, x) >> g @ x\
+        >> frobenius.Spider(2, 1, x)
+    F = Functor({x: 2, y: 3}, {f: list(range(12)), g: list(range(12))})
+    plan, expected = F.compile(diagram), F(diagram)
+    with backend('pytorch'):
+        result = plan(*(F(box).array for box in plan.boxes))
+        assert isinstance(result.array, torch.Tensor)
+    assert np.allclose(result.array.numpy(), expected.array)
+
+
 def test_AxiomError():
     m = Tensor([1, 0, 0, 1, 0, 1, 1, 0], Dim(2, 2), Dim(2))
     with raises(AxiomError) as err:
@@ -257,11 +367,184 @@ def test_Tensor_adjoint_eval():
 
 
 def test_non_numpy_eval():
+    expected = Tensor.swap(Dim(2), Dim(2)).array.tolist()
     with backend('torch'):
         with raises(Exception):
-            Swap(Dim(2), Dim(2)).eval()
+            Tensor.swap(Dim(2), Dim(2))
+        assert Swap(Dim(2), Dim(2)).eval().array.tolist() == expected
 
 
 def test_Tensor_array():
     box = Box("box", Dim(2), Dim(2), None)
     assert box.array is None
+
+
+def test_Diagram_eval_einsum():
+    x, y = Dim(2), Dim(3)
+    f = Box('f', x, x @ y, list(range(12)))
+    g = Box('g', y @ x, x, list(range(12, 0, -1)))
+    v = Box('v', Dim(1), y, [1, 2, 3])
+    for diagram in [
+            Id(x @ y), Swap(x, y), Cup(x, x), Cap(y, y), Spider(2, 3, x),
+            f >> Swap(x, y) >> y @ Spider(1, 2, x) >> g @ x,
+            Cap(x, x) @ v >> x @ f @ y >> x @ x @ Cup(y, y)
+            >> Spider(2, 1, x),
+            f @ Cap(y, y) >> x @ Swap(y, y) @ y >> x @ y @ Cup(y, y)]:
+        for strategy in ["naive", "greedy"]:
+            assert diagram.eval("einsum", strategy=strategy) == diagram.eval()
+    assert Spider(0, 0, y).eval("einsum").array == 3
+
+
+def test_Spider_eval_einsum():
+    x, n = frobenius.Ty('x'), Dim(3)
+    F = Functor({x: 3}, {})
+    for n_legs_in in range(4):
+        for n_legs_out in range(4):
+            spider = Spider(n_legs_in, n_legs_out, n)
+            expected = spider.eval("einsum")
+            assert spider.eval() == expected
+            assert F(frobenius.Spider(n_legs_in, n_legs_out, x)) == expected
+            assert F.compile(frobenius.Spider(n_legs_in, n_legs_out, x)
+                             @ x)() == expected @ Tensor.id(n)
+    assert Spider(0, 0, n).eval("einsum") == Tensor(3, Dim(1), Dim(1))
+
+
+def test_einsum_backends():
+    x = Dim(2)
+    f = Box('f', x, x @ x, list(range(8)))
+    diagram = Cap(x, x) >> x @ f >> x @ Swap(x, x) >> Cup(x, x) @ x
+    expected = diagram.eval(dtype=float).array
+    for name in ["jax", "pytorch", "tensorflow"]:
+        with backend(name):
+            result = diagram.eval("einsum", dtype=float).array
+        assert np.allclose(np.asarray(result), expected)
+
+
+def test_PathCache(tmp_path):
+    x = Dim(2)
+    f, g = Box('f', x, x, [1, 2, 3, 4]), Box('g', x, x, [0, 1, 1, 0])
+    filename = str(tmp_path / "paths.json")
+    cache = PathCache(maxsize=1, filename=filename)
+    for diagram in [f >> g >> f, g >> f >> g, f @ g, f >> g >> f]:
+        assert diagram.eval("einsum", path_cache=cache) == diagram.eval()
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 1)
+    cache.save()
+    loaded = PathCache(filename=filename)
+    assert loaded == cache
+    diagram = f >> f >> f
+    assert diagram.eval("einsum", path_cache=loaded) == diagram.eval()
+    assert loaded.hits == 1
+
+
+def test_default_path_cache(monkeypatch):
+    from discopy import config
+    monkeypatch.setattr(Diagram, "path_cache", None)
+    monkeypatch.setattr(config, "PATH_CACHE_SIZE", 3)
+    x = Dim(2)
+    f = Box('f', x, x, [1, 2, 3, 4])
+    assert (f >> f).eval("einsum") == (f >> f).eval()
+    assert Diagram.path_cache.maxsize == 3 and Diagram.path_cache.misses == 1
+    assert Box.default_path_cache() is Diagram.path_cache
+
+
+def test_Diagram_batch_eval():
+    x, y = Dim(2), Dim(3)
+    f = Box('f', Dim(1), x @ y)
+    g = Box('g', y @ x, x, list(range(12)))
+    diagram = f >> Swap(x, y) >> g
+    stack = np.arange(5 * 6).reshape((5, 2, 3))
+    expected = [
+        (Box('f', Dim(1), x @ y, array) >> Swap(x, y) >> g).eval().array
+        for array in stack]
+    assert np.all(diagram.batch_eval({f: stack}) == expected)
+    assert np.all(diagram.batch_eval({f: stack, g: [g.array] * 5})
+                  == expected)
+    assert g.batch_eval({}).shape == (1, 3, 2, 2)
+    for name in ["jax", "pytorch"]:
+        with backend(name):
+            result = diagram.batch_eval({f: stack}, dtype=float)
+        assert np.allclose(np.asarray(result), expected)
+
+
+def test_Functor_batch_call():
+    from discopy.grammar.pregroup import Ty, Word, Cup, Swap
+    n, s = Ty('n'), Ty('s')
+    nouns = [Word(name, n) for name in ["Alice", "Bob", "Charlie"]]
+    verb, adj = Word('loves', n.r @ s @ n.l), Word('big', n @ n.l)
+    grammar = Cup(n, n.r) @ s @ Cup(n.l, n)
+    sentences = [
+        x @ verb @ y >> grammar for x in nouns for y in nouns] + [
+        adj @ x @ verb @ y >> n @ Cup(n.l, n) @ n.r @ s @ n.l @ n
+        >> grammar for x in nouns for y in nouns] + [
+        x @ y >> Swap(n, n) for x in nouns for y in nouns]
+    ar = {x: np.random.rand(2) for x in nouns}
+    ar[verb], ar[adj] = np.random.rand(2 * 3 * 2), np.random.rand(2 * 2)
+    F = Functor({n: 2, s: 3}, ar, dom=rigid.Category(), dtype=float)
+    for result, sentence in zip(F.batch_call(sentences), sentences):
+        assert result.is_close(F(sentence))
+    F.memoize()
+    assert F.batch_call(sentences[::-1]) == F.batch_call(sentences)[::-1]
+    assert F.cache.hits > F.cache.misses
+    m = Ty('m')
+    people = [Word(name, m) for name in ["Diane", "Eve"]]
+    diagrams = [x @ y >> Swap(n, n) for x in nouns[:2] for y in nouns[:2]]\
+        + [x @ y >> Swap(m, m) for x in people for y in people]\
+        + [Swap(x, y) >> Swap(y, x) for x, y in [(n, n), (m, m), (n, m)]]
+    ar.update({x: np.random.rand(2) for x in people})
+    G = Functor({n: 2, m: 2}, ar, dom=rigid.Category(), dtype=float)
+    path_cache = PathCache()
+    results = G.batch_call(diagrams, path_cache=path_cache)
+    assert results == list(map(G, diagrams)) and path_cache.misses == 2
+
+
+def test_Diagram_eval_memory_limit():
+    from concurrent.futures import ThreadPoolExecutor
+    x = Dim(3)
+    A = [Box(f'A{i}', Dim(1), x @ x, list(range(i, i + 9))) for i in range(3)]
+    B = [Box(f'B{i}', x @ x, Dim(1), list(range(9, 0, -1))) for i in range(3)]
+    diagram = A[0] @ A[1] @ A[2] >> x @ B[0] @ B[1] @ x >> B[2]
+    expected = diagram.eval()
+    operands, inputs, output = diagram.to_einsum()
+    sizes = {i: 3 for idx in inputs for i in idx}
+    path = einsum_path(inputs, output, sizes, "naive")
+    assert max(product([sizes[i] for i in result])
+               for _, result in intermediates(inputs, output, path)) == 3 ** 6
+    assert len(einsum_slices(inputs, output, sizes, path, 3 ** 4)) == 2
+    for memory_limit in [3 ** 6, 3 ** 4, 1]:
+        assert diagram.eval("einsum", strategy="naive",
+                            memory_limit=memory_limit) == expected
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert diagram.eval("einsum", strategy="naive", memory_limit=1,
+                            pool=pool) == expected
+    with raises(ValueError):
+        (A[0] @ A[1]).eval("einsum", memory_limit=3 ** 3)
+
+
+def test_Diagram_estimate_cost():
+    x = Dim(3)
+    A = [Box(f'A{i}', Dim(1), x @ x) for i in range(3)]
+    B = [Box(f'B{i}', x @ x, Dim(1)) for i in range(3)]
+    diagram = A[0] @ A[1] @ A[2] >> x @ B[0] @ B[1] @ x >> B[2]
+    functor, naive, greedy = (
+        diagram.estimate_cost(strategy)
+        for strategy in ["functor", "naive", "greedy"])
+    assert functor['peak'] == naive['peak'] == 3 ** 6
+    assert functor['rank'] == naive['rank'] == 6
+    assert greedy['flops'] < naive['flops'] < functor['flops']
+    assert greedy['peak'] < naive['peak']
+    assert Swap(x, x).estimate_cost() == dict(flops=0, peak=3 ** 4, rank=4)
+    with raises(ValueError):
+        diagram.estimate_cost("unknown")
+
+
+def test_Diagram_estimate_cost_structural():
+    x = Dim(10)
+    spider = Spider(2, 2, x)
+    assert spider.estimate_cost() == dict(
+        flops=2 * 10 ** 4 + 10 ** 5, peak=10 ** 4, rank=4)
+    cups = Cap(x, x) >> x @ Cap(x, x) @ x >> Cup(x, x) @ Cup(x, x)
+    assert cups.estimate_cost() == dict(
+        flops=2 * (10 ** 2 + 10 ** 4), peak=10 ** 4, rank=4)
+    assert spider.estimate_cost()['flops'] < 10 ** 4 * 10 ** 2
+    spiders = Spider(3, 1, x) >> Spider(1, 3, x)
+    assert spiders.estimate_cost()['flops'] < 10 ** 6 * 10 + 10 ** 4 * 10 ** 3
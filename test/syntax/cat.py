@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import numpy
 from pytest import raises
 
 from discopy.cat import *
@@ -122,6 +123,23 @@ def test_Arrow_then():
     assert f.then(g) == f >> g == g << f
     with raises(TypeError) as err:
         f >> x
+    assert Id(x).then(f, g, g[::-1]).inside == (f, g, g[::-1])
+    with raises(AxiomError):
+        Id(x).then(f, g, f)
+
+
+def test_Arrow_then_chain(monkeypatch):
+    import discopy.cat
+    x, checks = Ob('x'), []
+    check = discopy.cat.assert_iscomposable
+    monkeypatch.setattr(discopy.cat, "assert_iscomposable",
+                        lambda f, g: checks.append(1) or check(f, g))
+    boxes = [Box(f'f{i}', x, x) for i in range(10 ** 4)]
+    arrow = Id(x)
+    for box in boxes:
+        arrow = arrow >> box
+    assert len(checks) == len(boxes)
+    assert arrow == Id(x).then(*boxes) and len(checks) == 2 * len(boxes)
 
 
 def test_Arrow_dagger():
@@ -219,6 +237,22 @@ def test_Functor_call():
     assert F(f.dagger()) == f
     assert F(g) == f >> g
     assert F(f >> g) == f.dagger() >> f >> g
+    assert F(Id(x).then(*1000 * [f >> f[::-1]])) == Id(y).then(
+        *1000 * [f[::-1] >> f])
+
+
+def test_Functor_memoize():
+    x, y, z = Ob('x'), Ob('y'), Ob('z')
+    f, g = Box('f', x, y), Box('g', y, z)
+    F = Functor({x: x, y: y, z: z}, lambda box: box).memoize(maxsize=1)
+    assert F(f >> g >> g[::-1] >> g) == f >> g >> g[::-1] >> g
+    assert (F.cache.hits, F.cache.misses) == (0, 4)
+    assert list(F.cache) == [g]
+    F.cache.clear()
+    assert (F.cache.hits, F.cache.misses, len(F.cache)) == (0, 0, 0)
+    h0, h1 = [Box('h', x, x, data=numpy.zeros(2)) for _ in range(2)]
+    assert F(h0 >> h1).inside == (h0, h1)
+    assert list(F.cache) == [h0] and F.cache.misses == 1
 
 
 def test_total_ordering():
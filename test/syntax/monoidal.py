@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import pickle
+
 from pytest import raises
 
 from discopy.cat import *
 from discopy.monoidal import *
+from discopy.utils import interning
 
 
 def test_Ty():
@@ -142,8 +145,87 @@ def test_Diagram_offsets():
     assert Diagram((), Ty('x'), Ty('x')).offsets == []
 
 
+def test_Diagram_encoding():
+    x, y = Ty('x'), Ty('y')
+    f, g = Box('f', x, y), Box('g', y @ y, x)
+    diagram = f @ f >> g >> f
+    encoding = diagram.encode(columnar=True)
+    assert encoding is diagram.encoding and len(encoding) == 4
+    assert encoding.table == (f, g)
+    assert list(encoding.box_ids) == [0, 0, 1, 0]
+    assert list(encoding.widths) == [2, 2, 2, 1, 1]
+    assert diagram.boxes == [f, f, g, f] and diagram.offsets == [0, 1, 0, 0]
+    assert Diagram.decode(encoding) == diagram == Diagram.decode(
+        *diagram.encode())
+    assert Id(x).encoding.widths.tolist() == [1]
+    assert not hasattr(diagram, "__dict__")
+    assert "encoding_cache" not in diagram.__getstate__()[1]
+    assert pickle.loads(pickle.dumps(diagram)).encoding is not encoding
+
+
+def test_Diagram_from_boxes():
+    x, y = Ty('x'), Ty('y')
+    f, g = Box('f', x, y), Box('g', y @ y, x)
+    assert Diagram.from_boxes(x @ x, [f, f, g], [0, 1, 0]) == f @ f >> g
+    assert Diagram.decode(x, iter([])) == Id(x)
+    with raises(AxiomError):
+        Diagram.from_boxes(x @ x, [f, g], [0, 0])
+    with raises(AxiomError):
+        Diagram.from_boxes(x, [f], [2])
+    with raises(ValueError):
+        Diagram.from_boxes(x, [f], [])
+
+
 def test_Diagram_hash():
     assert {Id(Ty('x')): 42}[Id(Ty('x'))] == 42
+    x, y = Ty('x'), Ty('y')
+    f, g = Box('f', x, y), Box('g', y, x)
+    assert hash(f) == hash(Diagram((Layer.cast(f), ), x, y))
+    d = f @ g >> g @ f
+    hash(d)
+    assert hash(d >> d) == hash(Diagram(2 * d.inside, x @ y, x @ y))
+    assert hash(f >> g) != hash(g >> f)
+
+
+def test_slots():
+    x, y = Ty('x'), Ty('y')
+    f = Box('f', x, y)
+    layer = Layer(x, f, y)
+    for obj in [x, x.inside[0], layer, f]:
+        assert not hasattr(obj, "__dict__")
+    assert layer.name == "x @ f @ y" and (x @ y).name == "x @ y"
+    assert Layer.cast(f).dom is x and Ty() @ x @ Ty() is x
+    d = f @ x >> f.dagger() @ x
+    hash(d)
+    assert pickle.loads(pickle.dumps(d)) == d
+    with raises(TypeError):
+        Layer(x, x, y)
+
+
+def test_DrawingAttribute():
+    x, y = Ty('x'), Ty('y')
+    f = Box('f', x, y, color="red")
+    assert not hasattr(f, "__dict__") and not hasattr(f, "shape")
+    assert pickle.loads(pickle.dumps(f)).color == "red"
+    drawing = f.to_drawing()
+    drawing.bubble_opening = True
+    assert drawing.color == "red" and isinstance(drawing, Box)
+
+    class Spider(Box):
+        color = "black"
+    spider = Spider('s', x, x)
+    assert spider.color == Spider.color == "black"
+    spider.color = "green"
+    assert spider.color == "green" and Spider('s', x, x).color == "black"
+    del spider.color
+    assert spider.color == "black"
+
+    with interning():
+        f_dagger = f.dagger()
+        assert f.dagger() is f_dagger
+        f_dagger.drawing_name = "f^dagger"
+        assert f.dagger() is not f_dagger
+        assert not hasattr(f.dagger(), "drawing_name")
 
 
 def test_Diagram_str():
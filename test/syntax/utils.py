@@ -13,3 +13,40 @@ zip_mock.open().__enter__().read.return_value =\
 @patch('zipfile.ZipFile', return_value=zip_mock)
 def test_load_corpus(a, b):
     assert load_corpus("[fake url]") == [Ob("a")]
+
+
+def test_interning():
+    from discopy.monoidal import Ty, Box
+    x, y = Ty('x'), Ty('y')
+    f = Box('f', x, y)
+    with interning():
+        assert x @ y is x @ y and Ty('x').inside[0] is Ty('x').inside[0]
+        assert f[::-1] is f[::-1] and f[::-1][::-1] == f
+        with interning(False):
+            assert x @ y is not x @ y
+        g = Box('g', x, y, data=[42])
+        assert g[::-1] is not g[::-1] and g[::-1] == g[::-1]
+    assert x @ y is not x @ y
+
+
+def test_trusted():
+    from pytest import raises
+    from discopy.cat import AxiomError
+    from discopy.monoidal import Ty, Box, Diagram
+    x, y = Ty('x'), Ty('y')
+    f = Box('f', x, y)
+    with raises(AxiomError):
+        f >> f
+    with trusted():
+        diagram = Diagram(f.inside + f.inside, x, y)
+        assert Diagram.decode(x, [(f, 0), (f, 0)]) == diagram
+        with trusted(False):
+            with raises(AxiomError):
+                Diagram(f.inside + f.inside, x, y)
+    with raises(AxiomError):
+        diagram.validate()
+    with trusted():
+        malformed = Diagram((f, ), x, y)
+    with raises(TypeError):
+        malformed.validate()
+    (f >> f[::-1]).validate()